@@ -135,6 +135,8 @@ class Drink(MenuItem):
 class MenuList:
     def __init__(self):
         self.__menu_items = []
+        self.__menu_item_by_id = {}
+        self.__menu_items_view = None
 
     # / ================================================================
     # - Getters
@@ -142,7 +144,9 @@ class MenuList:
 
     @property
     def menu_items(self):
-        return self.__menu_items.copy()
+        if self.__menu_items_view is None:
+            self.__menu_items_view = tuple(self.__menu_items)
+        return self.__menu_items_view
 
     # / ================================================================
     # - Setters
@@ -156,12 +160,11 @@ class MenuList:
         if not isinstance(menu_item, MenuItem):
             raise ValueError("Invalid menu item")
         self.__menu_items.append(menu_item)
+        self.__menu_item_by_id.setdefault(menu_item.item_id, menu_item)
+        self.__menu_items_view = None
 
     def get_menu_item(self, item_id):
-        for item in self.__menu_items:
-            if item.item_id == item_id:
-                return item
-        return None
+        return self.__menu_item_by_id.get(item_id)
 
     def get_menu_item_food(self):
         return [item for item in self.__menu_items if isinstance(item, Food)]
@@ -170,18 +173,17 @@ class MenuList:
         return [item for item in self.__menu_items if isinstance(item, Drink)]
 
     def get_menu_item_list(self):
-        return self.__menu_items.copy()
+        return self.menu_items
 
     def find_menu_item_by_id(self, item_id):
-        for item in self.__menu_items:
-            if item.item_id == item_id:
-                return item
-        return None
+        return self.__menu_item_by_id.get(item_id)
 
     def remove_menu_item(self, item_id):
         self.__menu_items = [
             item for item in self.__menu_items if item.item_id != item_id
         ]
+        self.__menu_item_by_id.pop(item_id, None)
+        self.__menu_items_view = None
 
     # / ================================================================
 
@@ -1,12 +1,33 @@
 from abc import ABC, abstractmethod
+from types import MappingProxyType
 
 from ENUM_STATUS import MemberTier
 
+# | ════════════════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
+# | #FFFF67
+
+_DISCOUNT_BY_TIER = MappingProxyType({
+    MemberTier.PLATINUM: 0.25,
+    MemberTier.GOLD: 0.20,
+    MemberTier.SILVER: 0.10,
+    MemberTier.BRONZE: 0.05,
+})
+
+# ยอดใช้จ่ายขั้นต่ำของแต่ละ tier เรียงจากสูงไปต่ำ
+_TIER_BY_MIN_SPENT = (
+    (2000, MemberTier.PLATINUM),
+    (1000, MemberTier.GOLD),
+    (500, MemberTier.SILVER),
+    (250, MemberTier.BRONZE),
+)
+
 # | ════════════════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
 # | #EFFF11
 
 
 class Person(ABC):
+    __slots__ = ("__name", "__user_id")
+
     def __init__(self, name, user_id):
         self.__name = name
         self.__user_id = user_id
@@ -43,6 +64,8 @@ class Person(ABC):
 
 
 class Customer(Person):
+    __slots__ = ("__phone_number", "__note", "__email")
+
     def __init__(self, name, user_id):
         super().__init__(name, user_id)
         self.__phone_number = ""
@@ -92,6 +115,7 @@ class Customer(Person):
 
 
 class Member(Customer):
+    __slots__ = ("__total_spent", "__member_tier", "__birth_date")
     __counter = 0
 
     def __init__(self, name):
@@ -115,6 +139,10 @@ class Member(Customer):
     def birth_date(self):
         return self.__birth_date
 
+    @property
+    def member_tier(self):
+        return self.__member_tier
+
     # / ════════════════════════════════════════════════════════════════
     # - Setters
     # / ════════════════════════════════════════════════════════════════
@@ -128,6 +156,13 @@ class Member(Customer):
     def birth_date(self, date):
         self.__birth_date = date
 
+    @member_tier.setter
+    def member_tier(self, tier):
+        # ตั้ง tier ตรง ๆ (ยอดใช้จ่ายครั้งถัดไปจะคำนวณ tier ใหม่จาก total_spent)
+        if not isinstance(tier, MemberTier):
+            raise ValueError("Invalid member tier")
+        self.__member_tier = tier
+
     # / ════════════════════════════════════════════════════════════════
     # - Methods
     # / ════════════════════════════════════════════════════════════════
@@ -139,27 +174,14 @@ class Member(Customer):
         return self.__member_tier
 
     def update_member_tier(self):
-        if self.__total_spent >= 2000:
-            self.__member_tier = MemberTier.PLATINUM
-        elif self.__total_spent >= 1000:
-            self.__member_tier = MemberTier.GOLD
-        elif self.__total_spent >= 500:
-            self.__member_tier = MemberTier.SILVER
-        elif self.__total_spent >= 250:
-            self.__member_tier = MemberTier.BRONZE
-        else:
-            self.__member_tier = MemberTier.NONE_TIER
+        for min_spent, tier in _TIER_BY_MIN_SPENT:
+            if self.__total_spent >= min_spent:
+                self.__member_tier = tier
+                return
+        self.__member_tier = MemberTier.NONE_TIER
 
     def get_discount(self):
-        if self.__member_tier == MemberTier.PLATINUM:
-            return 0.25
-        if self.__member_tier == MemberTier.GOLD:
-            return 0.20
-        if self.__member_tier == MemberTier.SILVER:
-            return 0.10
-        if self.__member_tier == MemberTier.BRONZE:
-            return 0.05
-        return 0.0
+        return _DISCOUNT_BY_TIER.get(self.__member_tier, 0.0)
 
     # / ════════════════════════════════════════════════════════════════
 
@@ -169,6 +191,7 @@ class Member(Customer):
 
 
 class WalkInCustomer(Customer):
+    __slots__ = ()
     __counter = 0
 
     def __init__(self):
@@ -205,6 +228,8 @@ class WalkInCustomer(Customer):
 
 
 class NonCustomer(Person):
+    __slots__ = ("__salary",)
+
     def __init__(self, name, user_id):
         super().__init__(name, user_id)
         self.__salary = 0
@@ -237,6 +262,7 @@ class NonCustomer(Person):
 
 
 class Manager(NonCustomer):
+    __slots__ = ("__managed_branches",)
     __counter = 0
 
     def __init__(self, name):
@@ -273,6 +299,7 @@ class Manager(NonCustomer):
 
 
 class Owner(NonCustomer):
+    __slots__ = ("__owned_branches", "__owned_branches_view")
     __counter = 0
 
     def __init__(self, name):
@@ -280,6 +307,7 @@ class Owner(NonCustomer):
         Owner.__counter += 1
         super().__init__(name, temp_id)
         self.__owned_branches = []
+        self.__owned_branches_view = None
 
     # / ════════════════════════════════════════════════════════════════
     # - Getters
@@ -287,7 +315,9 @@ class Owner(NonCustomer):
 
     @property
     def owned_branches(self):
-        return self.__owned_branches.copy()
+        if self.__owned_branches_view is None:
+            self.__owned_branches_view = tuple(self.__owned_branches)
+        return self.__owned_branches_view
 
     # / ════════════════════════════════════════════════════════════════
     # - Setters
@@ -299,6 +329,7 @@ class Owner(NonCustomer):
 
     def add_owned_branch(self, branch_id):
         self.__owned_branches.append(branch_id)
+        self.__owned_branches_view = None
 
     # / ════════════════════════════════════════════════════════════════
 
@@ -308,6 +339,7 @@ class Owner(NonCustomer):
 
 
 class Staff(NonCustomer):
+    __slots__ = ("__assigned_branch",)
     __counter = 0
 
     def __init__(self, name):
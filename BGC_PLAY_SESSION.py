@@ -1,11 +1,38 @@
 import datetime
 import math
+import re
 
 from BGC_MENU import *
 from BGC_PAYMENT import *
 
 from ENUM_STATUS import TableStatus, BoardGameStatus
 
+# | ════════════════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
+# | #FFFF67
+
+_DATETIME_FORMATS = (
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%dT%H:%M",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M",
+)
+_ISO_DATETIME = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}[T ][0-9]{2}:[0-9]{2}(:[0-9]{2})?")
+
+
+def parse_datetime_str(value):
+    # รูปแบบเต็ม (เลขสองหลัก) ใช้ fromisoformat ซึ่งเร็วกว่า strptime มาก
+    if _ISO_DATETIME.fullmatch(value):
+        try:
+            return datetime.datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    for fmt in _DATETIME_FORMATS:
+        try:
+            return datetime.datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    return None
+
 # | ════════════════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
 # | #EFFF11
 
@@ -120,6 +147,7 @@ class Table:
         Table.__counter += 1
         self.__capacity = capacity
         self.__status = TableStatus.AVAILABLE
+        self.__status_listener = None
 
     # / ════════════════════════════════════════════════════════════════
     # - Getters
@@ -147,12 +175,18 @@ class Table:
 
     @status.setter
     def status(self, status):
+        previous_status = self.__status
         self.__status = status
+        if self.__status_listener is not None and previous_status != status:
+            self.__status_listener(self)
 
     # / ════════════════════════════════════════════════════════════════
     # - Methods
     # / ════════════════════════════════════════════════════════════════
 
+    def set_status_listener(self, listener):
+        self.__status_listener = listener
+
     # / ════════════════════════════════════════════════════════════════
 
 
@@ -171,10 +205,17 @@ class PlaySession:
         self.__end_time = None
         self.__current_players_id = []
         self.__current_board_games_id = []
+        self.__current_board_games_id_set = set()
         self.__current_order = []
+        self.__order_by_id = {}
         self.__reservation_id = None
         self.__payment = None
         self.__game_penalty = []
+        # tuple snapshot ของ list ด้านบน สร้างใหม่เมื่อ list ถูกแก้ไขเท่านั้น
+        self.__players_view = None
+        self.__board_games_view = None
+        self.__order_view = None
+        self.__penalty_view = None
         self.__reserved_duration = reserved_duration
         self.__reserved_end_time = reserved_end_time
         self.__deposit = deposit
@@ -201,15 +242,21 @@ class PlaySession:
 
     @property
     def current_players_id(self):
-        return self.__current_players_id.copy()
+        if self.__players_view is None:
+            self.__players_view = tuple(self.__current_players_id)
+        return self.__players_view
 
     @property
     def current_board_games_id(self):
-        return self.__current_board_games_id.copy()
+        if self.__board_games_view is None:
+            self.__board_games_view = tuple(self.__current_board_games_id)
+        return self.__board_games_view
 
     @property
     def current_order(self):
-        return self.__current_order.copy()
+        if self.__order_view is None:
+            self.__order_view = tuple(self.__current_order)
+        return self.__order_view
 
     @property
     def reservation_id(self):
@@ -221,7 +268,9 @@ class PlaySession:
 
     @property
     def game_penalty(self):
-        return self.__game_penalty.copy()
+        if self.__penalty_view is None:
+            self.__penalty_view = tuple(self.__game_penalty)
+        return self.__penalty_view
 
     @property
     def reserved_duration(self):
@@ -240,14 +289,7 @@ class PlaySession:
             return False
         now = current_time if current_time is not None else datetime.datetime.now()
         if isinstance(now, str):
-            parsed = None
-            for fmt in ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%dT%H:%M",
-                        "%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M"):
-                try:
-                    parsed = datetime.datetime.strptime(now, fmt)
-                    break
-                except ValueError:
-                    continue
+            parsed = parse_datetime_str(now)
             now = parsed if parsed else datetime.datetime.now()
         return now >= self.__reserved_end_time
 
@@ -279,12 +321,19 @@ class PlaySession:
 
     def add_players_id(self, player_id):
         self.__current_players_id.append(player_id)
+        self.__players_view = None
 
     def add_board_games_id(self, board_game_id):
         self.__current_board_games_id.append(board_game_id)
+        self.__current_board_games_id_set.add(board_game_id)
+        self.__board_games_view = None
+
+    def has_board_game_id(self, board_game_id):
+        return board_game_id in self.__current_board_games_id_set
 
     def add_game_penalty(self, game_id, price=0.0):
         self.__game_penalty.append({"game_id": game_id, "price": price})
+        self.__penalty_view = None
 
     def get_total_players(self):
         return len(self.__current_players_id)
@@ -294,14 +343,22 @@ class PlaySession:
             raise ValueError("Type Error : Invalid order")
         new_order = Order(menu_item)
         self.__current_order.append(new_order)
+        self.__order_by_id[new_order.order_id] = new_order
+        self.__order_view = None
         return new_order
+
+    def find_order_by_id(self, order_id):
+        return self.__order_by_id.get(order_id)
         
 
     def remove_board_games_id(self, board_game_id):
         self.__current_board_games_id.remove(board_game_id)
+        self.__current_board_games_id_set.discard(board_game_id)
+        self.__board_games_view = None
 
     def remove_players_id(self, player_id):
         self.__current_players_id.remove(player_id)
+        self.__players_view = None
 
     def duration(self, current_time=None):
         start = self.__start_time
@@ -310,14 +367,7 @@ class PlaySession:
         if end is None:
             end = datetime.datetime.now()
         elif isinstance(end, str):
-            parsed = None
-            for fmt in ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%dT%H:%M",
-                        "%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M"):
-                try:
-                    parsed = datetime.datetime.strptime(end, fmt)
-                    break
-                except ValueError:
-                    continue
+            parsed = parse_datetime_str(end)
             end = parsed if parsed else datetime.datetime.now()
 
         if start is None:
@@ -2,6 +2,15 @@ from datetime import datetime
 
 from ENUM_STATUS import ReservationStatus
 
+# | ════════════════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
+# | #FFFF67
+
+
+def time_to_minutes(time_str):
+    parsed = datetime.strptime(time_str, "%H:%M")
+    return parsed.hour * 60 + parsed.minute
+
+
 # | ════════════════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
 # | #EFFF11
 
@@ -34,6 +43,10 @@ class Reservation:
         self.__date = date
         self.__start_time = start_time
         self.__end_time = end_time
+        self.__start_minute = (
+            self.__reservation_time.hour * 60 + self.__reservation_time.minute
+        )
+        self.__end_minute = time_to_minutes(end_time)
         self.__total_player = total_player
         self.__status = ReservationStatus.PENDING
         self.__deposit = deposit
@@ -90,6 +103,14 @@ class Reservation:
     def end_time(self):
         return self.__end_time
 
+    @property
+    def start_minute(self):
+        return self.__start_minute
+
+    @property
+    def end_minute(self):
+        return self.__end_minute
+
     @property
     def total_player(self):
         return self.__total_player
@@ -102,26 +123,17 @@ class Reservation:
     # - Setters
     # / ════════════════════════════════════════════════════════════════
 
-    @customer_id.setter
-    def customer_id(self, value):
-        self.__customer_id = value
-
     @branch_id.setter
     def branch_id(self, value):
         self.__branch_id = value
 
-    @table_id.setter
-    def table_id(self, value):
-        self.__table_id = value
+    # customer_id / table_id / reservation_time ไม่มี setter: CafeSystem จัดเก็บการจองตาม
+    # customer และ (table_id, date) และใช้ start_minute ที่คำนวณไว้ตอนสร้าง ถ้าแก้ทีหลังจะทำให้ index ผิด
 
     # @reservation_date.setter
     # def reservation_date(self, value):
     #     self.__reservation_date = value
 
-    @reservation_time.setter
-    def reservation_time(self, value):
-        self.__reservation_time = value
-
     # @duration.setter
     # def duration(self, value):
     #     self.__duration = value
@@ -146,10 +158,10 @@ class Reservation:
 
         try:
             self.status = ReservationStatus(new_status)
-        except ValueError:
+        except ValueError as e:
             raise ValueError(
                 f"Invalid status: {new_status}. Allowed values are: {[e.value for e in ReservationStatus]}"
-            )
+            ) from e
 
     def to_dict(self):
         """สำหรับแปลงเป็น JSON ส่งผ่าน API / MCP"""
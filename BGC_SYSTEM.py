@@ -2,6 +2,7 @@ from datetime import *
 import time
 import random
 import math
+from types import MappingProxyType
 
 from BGC_MENU import *
 from BGC_PAYMENT import *
@@ -29,6 +30,81 @@ def validate_id(_id, list_type_id):
         raise ValueError(f"Invalid ID : ID must be start with {list_type_id}")
 
 
+def build_cash_method(total, kwargs):
+    try:
+        paid_amount = kwargs.get("paid_amount", total)
+        paid_amount = float(paid_amount)
+    except (TypeError, ValueError) as e:
+        raise ValueError("paid_amount must be a valid number") from e
+
+    if paid_amount < total:
+        raise ValueError("Paid amount is not enough")
+
+    payment_method = Cash(paid_amount)
+    payment_method.change = paid_amount - total
+    return payment_method
+
+
+def build_card_method(total, kwargs):
+    try:
+        return CreditCard(
+            kwargs["card_number"], kwargs["expiry_date"], kwargs["cvv"]
+        )
+    except KeyError as e:
+        raise ValueError(f"Missing required field for card payment: {e}") from e
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid card payment details: {e}") from e
+
+
+def build_online_method(total, kwargs):
+    try:
+        return OnlinePayment(kwargs["email"])
+    except KeyError as e:
+        raise ValueError("Missing required field for online payment: email") from e
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid online payment details: {e}") from e
+
+
+PAYMENT_METHOD_BUILDERS = MappingProxyType({
+    "cash": build_cash_method,
+    "card": build_card_method,
+    "online": build_online_method,
+})
+
+# order ที่ยังไม่เสิร์ฟ (ยกเลิกได้ตอน force checkout)
+_OPEN_ORDER_STATUSES = frozenset((OrderStatus.PENDING, OrderStatus.PREPARING))
+
+# ช่วงเวลาของการจอง (สร้างครั้งเดียว ไม่ต้องสร้าง timedelta ใหม่ทุกรอบ loop)
+_NO_SHOW_GRACE = timedelta(minutes=15)
+_RESERVED_HOLD_BEFORE = timedelta(hours=1)
+_MIN_LEAD_TIME = timedelta(hours=1)
+
+# เงื่อนไขการจองตามระดับสมาชิก (tier ที่ไม่อยู่ในตารางใช้ค่า default)
+_DEFAULT_ACTIVE_QUOTA = 1
+_ACTIVE_QUOTA_BY_TIER = MappingProxyType({
+    MemberTier.BRONZE: 1,
+    MemberTier.SILVER: 2,
+    MemberTier.GOLD: 3,
+    MemberTier.PLATINUM: 4,
+})
+
+_DEFAULT_ADVANCE_DAYS = 5
+_ADVANCE_DAYS_BY_TIER = MappingProxyType({
+    MemberTier.BRONZE: 5,
+    MemberTier.SILVER: 14,
+    MemberTier.GOLD: 21,
+    MemberTier.PLATINUM: 30,
+})
+
+_DEFAULT_DURATION_HOURS = 2
+_DURATION_HOURS_BY_TIER = MappingProxyType({
+    MemberTier.BRONZE: 2,
+    MemberTier.SILVER: 3.5,
+    MemberTier.GOLD: 7,
+    MemberTier.PLATINUM: 999,
+})
+
+
 # | ════════════════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
 # | #EFFF11
 
@@ -36,9 +112,19 @@ temp_previous = ""
 class CafeSystem:
     def __init__(self):
         self.__person = []
-        self.__cafe_branches = []
+        self.__person_by_id = {}
+        self.__person_by_name = {}
+        self.__cafe_branches = {}  # branch_id -> CafeBranch (เรียงตามลำดับที่สร้าง)
+        self.__cafe_branch_id_by_name = {}
         self.__reservations = []
+        self.__reservation_by_id = {}
+        self.__reservations_by_table_date = {}
+        self.__reservations_by_customer = {}
         self.__simulated_time = None
+        # tuple snapshot ของ collection ด้านบน สร้างใหม่เมื่อถูกแก้ไขเท่านั้น
+        self.__person_view = None
+        self.__cafe_branches_view = None
+        self.__reservations_view = None
 
     # / ════════════════════════════════════════════════════════════════
     # - Getters
@@ -46,15 +132,21 @@ class CafeSystem:
 
     @property
     def person(self):
-        return self.__person.copy()
+        if self.__person_view is None:
+            self.__person_view = tuple(self.__person)
+        return self.__person_view
 
     @property
     def cafe_branches(self):
-        return self.__cafe_branches.copy()
+        if self.__cafe_branches_view is None:
+            self.__cafe_branches_view = tuple(self.__cafe_branches.values())
+        return self.__cafe_branches_view
 
     @property
     def reservations(self):
-        return self.__reservations.copy()
+        if self.__reservations_view is None:
+            self.__reservations_view = tuple(self.__reservations)
+        return self.__reservations_view
 
     def get_time(self):
         if self.__simulated_time is not None:
@@ -66,19 +158,11 @@ class CafeSystem:
             self.__simulated_time = None
             return "System time reset to real-time."
             
-        formats = (
-            "%Y-%m-%dT%H:%M:%S", 
-            "%Y-%m-%dT%H:%M", 
-            "%Y-%m-%d %H:%M:%S", 
-            "%Y-%m-%d %H:%M"
-        )
-        for fmt in formats:
-            try:
-                self.__simulated_time = datetime.strptime(time_str, fmt)
-                return f"System time set to {self.__simulated_time}"
-            except ValueError:
-                continue
-        raise ValueError(f"Invalid time format: {time_str}")
+        parsed = parse_datetime_str(time_str)
+        if parsed is None:
+            raise ValueError(f"Invalid time format: {time_str}")
+        self.__simulated_time = parsed
+        return f"System time set to {self.__simulated_time}"
 
     # / ════════════════════════════════════════════════════════════════
     # - Methods
@@ -89,6 +173,11 @@ class CafeSystem:
         if not isinstance(person, Person):
             raise TypeError("Type Error : must be an instance of Person")
         self.__person.append(person)
+        self.__person_view = None
+        # Owner ทุกคนใช้ id เดียวกัน จึงเก็บคนแรกไว้เหมือนการวนหาแบบเดิม
+        self.__person_by_id.setdefault(person.user_id, person)
+        key = self.__person_name_key(person.name)
+        self.__person_by_name.setdefault(key, []).append(person)
 
     def create_owner(self, name, requester_id=None):
         self.__authorize(requester_id, [Owner])
@@ -97,7 +186,7 @@ class CafeSystem:
             self.add_person(new_owner)
             return new_owner
         except (TypeError, ValueError) as e:
-            raise ValueError(f"Failed to create owner: {e}")
+            raise ValueError(f"Failed to create owner: {e}") from e
 
     def create_manager(self, name, requester_id=None):
         self.__authorize(requester_id, [Owner])
@@ -106,7 +195,7 @@ class CafeSystem:
             self.add_person(new_manager)
             return new_manager
         except (TypeError, ValueError) as e:
-            raise ValueError(f"Failed to create manager: {e}")
+            raise ValueError(f"Failed to create manager: {e}") from e
 
     def create_staff(self, name, requester_id=None):
         self.__authorize(requester_id, [Owner, Manager])
@@ -115,7 +204,7 @@ class CafeSystem:
             self.add_person(new_staff)
             return new_staff
         except (TypeError, ValueError) as e:
-            raise ValueError(f"Failed to create staff: {e}")
+            raise ValueError(f"Failed to create staff: {e}") from e
 
     def create_customer_member(self, name):
         try:
@@ -123,7 +212,7 @@ class CafeSystem:
             self.add_person(new_customer)
             return new_customer
         except (TypeError, ValueError) as e:
-            raise ValueError(f"Failed to create member: {e}")
+            raise ValueError(f"Failed to create member: {e}") from e
 
     def create_customer_walk_in(self):
         try:
@@ -131,7 +220,7 @@ class CafeSystem:
             self.add_person(new_walk_in)
             return new_walk_in
         except (TypeError, ValueError) as e:
-            raise ValueError(f"Failed to create walk-in customer: {e}")
+            raise ValueError(f"Failed to create walk-in customer: {e}") from e
 
     def add_owner_to_branch(self, branch_id, owner_id, requester_id=None):
         self.__authorize(requester_id, [Owner])
@@ -149,7 +238,7 @@ class CafeSystem:
             cafe_branch.add_owner(owner)
             owner.add_owned_branch(branch_id)
         except TypeError as e:
-            raise ValueError(f"Cannot add owner: {e}")
+            raise ValueError(f"Cannot add owner: {e}") from e
 
     def add_manager_to_branch(self, branch_id, manager_id, requester_id=None):
         self.__authorize(requester_id, [Owner])
@@ -168,7 +257,7 @@ class CafeSystem:
             cafe_branch.add_manager(manager)
             manager.managed_branches = branch_id
         except TypeError as e:
-            raise ValueError(f"Cannot add manager: {e}")
+            raise ValueError(f"Cannot add manager: {e}") from e
 
     def add_staff_to_branch(self, branch_id, staff_id, requester_id=None):
         self.__authorize(requester_id, [Owner, Manager])
@@ -187,26 +276,22 @@ class CafeSystem:
             cafe_branch.add_staff(staff)
             staff.assigned_branch = branch_id
         except TypeError as e:
-            raise ValueError(f"Cannot add staff: {e}")
+            raise ValueError(f"Cannot add staff: {e}") from e
 
     def get_person(self):
-        return self.__person.copy()
+        return self.person
 
     def get_person_by_type(self, person_type):
         return [person for person in self.__person if isinstance(person, person_type)]
 
     def find_person_by_id(self, user_id):
-        for person in self.__person:
-            if person.user_id == user_id:
-                return person
-        return None
+        return self.__person_by_id.get(user_id)
 
     def find_person_by_name(self, name):
-        name = name.lower()
-        for person in self.__person:
-            if person.name.lower() == name:
-                return person
-        return None
+        bucket = self.__person_by_name.get(name.lower())
+        if not bucket:
+            return None
+        return bucket[0]
 
     def remove_person_by_id(self, user_id, requester_id=None):
         self.__authorize(requester_id, [Owner, Manager])
@@ -217,6 +302,13 @@ class CafeSystem:
             raise ValueError("Invalid ID : Person not found")
 
         self.__person.remove(person)
+        self.__person_view = None
+        del self.__person_by_id[user_id]
+        for other in self.__person:
+            if other.user_id == user_id:
+                self.__person_by_id[user_id] = other
+                break
+        self.__unindex_person_name(person, self.__person_name_key(person.name))
 
     def update_person_by_id(self, user_id, name, requester_id=None):
         self.__authorize(requester_id, [Owner, Manager])
@@ -226,10 +318,18 @@ class CafeSystem:
         if person is None:
             raise ValueError("Invalid ID : Person not found")
 
+        old_key = self.__person_name_key(person.name)
         try:
             person.name = name
         except ValueError as e:
-            raise ValueError(f"Cannot update person : {e}")
+            raise ValueError(f"Cannot update person : {e}") from e
+
+        self.__unindex_person_name(person, old_key)
+        new_key = self.__person_name_key(person.name)
+        # สร้าง bucket ใหม่ตามลำดับใน self.__person เพื่อให้ชื่อซ้ำคืนคนแรกเหมือนเดิม
+        self.__person_by_name[new_key] = [
+            p for p in self.__person if self.__person_name_key(p.name) == new_key
+        ]
 
     def add_spent(self, customer_id, amount):
         validate_id(customer_id, ["MEMBER", "WALK"])
@@ -245,12 +345,11 @@ class CafeSystem:
             raise ValueError("Only Members can accumulate total spent")
 
         try:
-
             customer.total_spent = amount
+        except TypeError as e:
+            raise ValueError(f"Failed to add spent amount: {e}") from e
 
-            return customer
-        except Exception as e:
-            raise ValueError(f"Failed to add spent amount: {e}")
+        return customer
 
     # / ════════════════════════════════════════════════════════════════
     # \ CAFE BRANCH
@@ -263,11 +362,14 @@ class CafeSystem:
 
             new_cafe_branch = CafeBranch(
                 cafe_branch_name, cafe_branch_location)
-            self.__cafe_branches.append(new_cafe_branch)
+            self.__cafe_branches[new_cafe_branch.branch_id] = new_cafe_branch
+            self.__cafe_branches_view = None
+            self.__cafe_branch_id_by_name.setdefault(
+                cafe_branch_name.lower(), new_cafe_branch.branch_id)
             return new_cafe_branch
 
         except (TypeError, ValueError) as e:
-            raise ValueError(f"Failed to create cafe branch : {e}")
+            raise ValueError(f"Failed to create cafe branch : {e}") from e
 
     def get_cafe_branches(self):
         return self.cafe_branches
@@ -277,38 +379,36 @@ class CafeSystem:
             return None
 
         if _id.startswith("BRCH-"):
-            for cafe_branch in self.__cafe_branches:
-                if cafe_branch.branch_id == _id:
-                    return cafe_branch
+            return self.__cafe_branches.get(_id)
         elif _id.startswith("PS-"):
-            for cafe_branch in self.__cafe_branches:
+            for cafe_branch in self.__cafe_branches.values():
                 if cafe_branch.find_play_session_by_id(_id):          # active
                     return cafe_branch
                 if cafe_branch.find_play_session_history_by_id(_id):  # history
                     return cafe_branch
         elif _id.startswith("TABLE-"):
-            for cafe_branch in self.__cafe_branches:
+            for cafe_branch in self.__cafe_branches.values():
                 if cafe_branch.find_table_by_id(_id):
                     return cafe_branch
         elif _id.startswith("BG-"):
-            for cafe_branch in self.__cafe_branches:
+            for cafe_branch in self.__cafe_branches.values():
                 if cafe_branch.find_board_game_by_id(_id):
                     return cafe_branch
         elif _id.startswith("FOOD-") or _id.startswith("DRINK-"):
-            for cafe_branch in self.__cafe_branches:
+            for cafe_branch in self.__cafe_branches.values():
                 if cafe_branch.find_menu_item_by_id(_id):
                     return cafe_branch
         return None
 
     def find_play_session_by_id(self, any_id):
-        for branch in self.__cafe_branches:
+        for branch in self.__cafe_branches.values():
             session = branch.find_play_session_by_id(any_id)
             if session:
                 return session
         return None
 
     def find_play_session_history_by_id(self, any_id):
-        for branch in self.__cafe_branches:
+        for branch in self.__cafe_branches.values():
             session = branch.find_play_session_history_by_id(any_id)
             if session:
                 return session
@@ -318,11 +418,10 @@ class CafeSystem:
         if not isinstance(name, str):
             return None
 
-        name = name.lower()
-        for cafe_branch in self.__cafe_branches:
-            if cafe_branch.name.lower() == name:
-                return cafe_branch
-        return None
+        branch_id = self.__cafe_branch_id_by_name.get(name.lower())
+        if branch_id is None:
+            return None
+        return self.__cafe_branches[branch_id]
 
     def remove_cafe_branch_by_id(self, cafe_branch_id, requester_id=None):
         self.__authorize(requester_id, [Owner])
@@ -332,7 +431,9 @@ class CafeSystem:
         if cafe_branch is None:
             raise ValueError("Invalid ID : Cafe Branch not found")
 
-        self.__cafe_branches.remove(cafe_branch)
+        del self.__cafe_branches[cafe_branch_id]
+        self.__cafe_branches_view = None
+        self.__reindex_cafe_branch_name(cafe_branch.name)
 
     def update_cafe_branch_by_id(self, branch_id, name, location, requester_id=None):
         self.__authorize(requester_id, [Owner])
@@ -342,11 +443,26 @@ class CafeSystem:
         if cafe_branch is None:
             raise ValueError("Invalid ID : Cafe Branch not found")
 
+        old_name = cafe_branch.name
         try:
             cafe_branch.name = name
             cafe_branch.location = location
         except (TypeError, ValueError) as e:
-            raise ValueError(f"Cannot update branch: {e}")
+            raise ValueError(f"Cannot update branch: {e}") from e
+
+        self.__reindex_cafe_branch_name(old_name)
+        self.__reindex_cafe_branch_name(cafe_branch.name)
+
+    def __reindex_cafe_branch_name(self, name):
+        # ชื่อซ้ำกันได้ ให้ชี้ไปที่สาขาแรกที่ใช้ชื่อนี้เสมอ
+        if not isinstance(name, str):
+            return
+        key = name.lower()
+        for cafe_branch in self.__cafe_branches.values():
+            if isinstance(cafe_branch.name, str) and cafe_branch.name.lower() == key:
+                self.__cafe_branch_id_by_name[key] = cafe_branch.branch_id
+                return
+        self.__cafe_branch_id_by_name.pop(key, None)
 
     # / ════════════════════════════════════════════════════════════════
     # \ RESERVATION
@@ -373,11 +489,11 @@ class CafeSystem:
                 raise ValueError(
                     f"Invalid time format for {t_name}: '{t_val}'. Expected HH:MM (e.g. 18:00)")
         try:
-            datetime.strptime(date, "%Y-%m-%d")
-            datetime.strptime(start_time, "%H:%M")
-            datetime.strptime(end_time, "%H:%M")
+            reservation_date = datetime.strptime(date, "%Y-%m-%d").date()
+            start_minute = time_to_minutes(start_time)
+            end_minute = time_to_minutes(end_time)
         except ValueError as e:
-            raise ValueError(f"Invalid date/time value: {e}")
+            raise ValueError(f"Invalid date/time value: {e}") from e
 
         validate_id(customer_id, ["MEMBER", "WALK"])
         validate_id(branch_id, ["BRCH"])
@@ -401,11 +517,11 @@ class CafeSystem:
 
         # 🟢 ด่านที่ 1: ตรวจสอบกฎเวลาและระยะเวลา
         try:
-            self.__validate_minimum_lead_time(date, start_time)
-            self.__validate_advance_booking(date, tier)
-            self.__validate_duration(start_time, end_time, tier)
+            self.__validate_minimum_lead_time(reservation_date, start_minute)
+            self.__validate_advance_booking(reservation_date, tier)
+            self.__validate_duration(start_minute, end_minute, tier)
         except ValueError as e:
-            raise ValueError(f"Failed to make reservation: {e}")
+            raise ValueError(f"Failed to make reservation: {e}") from e
 
         branch = self.find_cafe_branch_by_id(branch_id)
         if branch is None:
@@ -415,21 +531,21 @@ class CafeSystem:
         target_table = None
 
         if table_id == "auto":
-            available_tables = []
+            # หาโต๊ะว่างที่เล็กที่สุดในรอบเดียว (โต๊ะแรกชนะถ้าขนาดเท่ากัน)
             for table in branch.tables:
-                if table.capacity >= total_player:
-                    if self.__is_table_free(table.table_id, date, start_time, end_time):
-                        available_tables.append(table)
+                if table.capacity < total_player:
+                    continue
+                if target_table is not None and table.capacity >= target_table.capacity:
+                    continue
+                if self.__is_table_free(
+                    table.table_id, date, start_minute, end_minute
+                ):
+                    target_table = table
 
-            if not available_tables:
+            if target_table is None:
                 raise ValueError(
                     "No available tables for the requested capacity and time."
                 )
-
-            target_table = available_tables[0]
-            for t in available_tables:
-                if t.capacity < target_table.capacity:
-                    target_table = t
         else:
             validate_id(table_id, ["TABLE"])
 
@@ -440,7 +556,7 @@ class CafeSystem:
                 raise ValueError(
                     "The specified table does not have enough capacity.")
             if not self.__is_table_free(
-                target_table.table_id, date, start_time, end_time
+                target_table.table_id, date, start_minute, end_minute
             ):
                 raise ValueError(
                     "The specified table is already booked for this time slot."
@@ -457,8 +573,8 @@ class CafeSystem:
         try:
             # สร้าง Payment Record สำหรับมัดจำ
             self.create_payment(deposit_amount, method_type=method_type, **kwargs)
-        except Exception as e:
-            raise ValueError(f"Deposit payment failed: {e}")
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Deposit payment failed: {e}") from e
 
         # 🟢 ด่านที่ 4: สร้างการจอง
         try:
@@ -477,23 +593,42 @@ class CafeSystem:
             self.add_reservation(new_reservation)
             return new_reservation
         except (TypeError, ValueError) as e:
-            raise ValueError(f"Failed to create reservation: {e}")
+            raise ValueError(f"Failed to create reservation: {e}") from e
 
     def add_reservation(self, reservation):
         if not isinstance(reservation, Reservation):
             raise TypeError("Must be an instance of Reservation")
         self.__reservations.append(reservation)
-
-    def get_reservations(self):
-        return self.reservations
+        self.__reservations_view = None
+        self.__reservation_by_id[reservation.reservation_id] = reservation
+        key = (reservation.table_id, reservation.date)
+        self.__reservations_by_table_date.setdefault(key, []).append(reservation)
+        self.__reservations_by_customer.setdefault(
+            reservation.customer_id, []).append(reservation)
+
+    def get_reservations(self, limit=None, offset=0, branch_id=None):
+        # bool เป็น subclass ของ int จึงต้องตัดออกเอง (True ไม่ใช่ page size)
+        if limit is not None and (
+            isinstance(limit, bool) or not isinstance(limit, int) or limit < 0
+        ):
+            raise ValueError("limit must be a non-negative integer")
+        if isinstance(offset, bool) or not isinstance(offset, int) or offset < 0:
+            raise ValueError("offset must be a non-negative integer")
+
+        reservations = self.reservations
+        if branch_id is not None:
+            reservations = tuple(
+                r for r in reservations if r.branch_id == branch_id
+            )
+        if limit is None and offset == 0:
+            return reservations
+        end = None if limit is None else offset + limit
+        return reservations[offset:end]
 
     def find_reservation_by_id(self, reservation_id):
         validate_id(reservation_id, ["RESV"])
 
-        for reservation in self.__reservations:
-            if reservation.reservation_id == reservation_id:
-                return reservation
-        return None
+        return self.__reservation_by_id.get(reservation_id)
 
     def remove_reservation_by_id(self, reservation_id):
         validate_id(reservation_id, ["RESV"])
@@ -502,6 +637,11 @@ class CafeSystem:
         if reservation is None:
             raise ValueError("Reservation not found")
         self.__reservations.remove(reservation)
+        self.__reservations_view = None
+        del self.__reservation_by_id[reservation_id]
+        key = (reservation.table_id, reservation.date)
+        self.__reservations_by_table_date[key].remove(reservation)
+        self.__reservations_by_customer[reservation.customer_id].remove(reservation)
 
     def cancel_reservation(self, reservation_id, current_time=None):
         validate_id(reservation_id, ["RESV"])
@@ -521,13 +661,7 @@ class CafeSystem:
         elif isinstance(current_time, datetime):
             now = current_time
         elif isinstance(current_time, str):
-            parsed = None
-            for fmt in ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%dT%H:%M", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M"):
-                try:
-                    parsed = datetime.strptime(current_time, fmt)
-                    break
-                except ValueError:
-                    continue
+            parsed = parse_datetime_str(current_time)
             if parsed is None:
                 raise ValueError(
                     "Invalid current_time format. Expected 'YYYY-MM-DD HH:MM' or ISO format.")
@@ -541,7 +675,7 @@ class CafeSystem:
                 f"{reservation.date} {reservation.start_time}", "%Y-%m-%d %H:%M"
             )
         except ValueError as e:
-            raise ValueError(f"Invalid reservation date/time format: {e}")
+            raise ValueError(f"Invalid reservation date/time format: {e}") from e
 
         if now > reservation_time:
             raise ValueError(
@@ -566,7 +700,7 @@ class CafeSystem:
                 table = branch.find_table_by_id(reservation.table_id)
                 if table is not None and table.status == TableStatus.RESERVED:
                     table.status = TableStatus.AVAILABLE
-        except Exception:
+        except ValueError:
             pass
         return True
 
@@ -599,101 +733,51 @@ class CafeSystem:
     # \ PRIVATE HELPER METHODS (BUSINESS RULES VALIDATION)
     # / ════════════════════════════════════════════════════════════════
 
-    def __is_table_free(self, table_id, date_str, start_time, end_time):
-        try:
-            new_start = datetime.strptime(start_time, "%H:%M")
-            new_end = datetime.strptime(end_time, "%H:%M")
-        except ValueError as e:
-            raise ValueError(f"Invalid time format (expected HH:MM): {e}")
-
-        for reservation in self.__reservations:
-            if reservation.date == date_str and reservation.table_id == table_id:
-                if reservation.status == ReservationStatus.PENDING:
-                    try:
-                        exist_start = datetime.strptime(
-                            reservation.start_time, "%H:%M")
-                        exist_end = datetime.strptime(
-                            reservation.end_time, "%H:%M")
-                    except ValueError:
-                        continue  # ข้ามการจองที่มี format ผิด
-                    if new_start < exist_end and new_end > exist_start:
-                        return False
+    def __is_table_free(self, table_id, date_str, new_start, new_end):
+        # เทียบเฉพาะการจองของโต๊ะนี้ในวันนี้ (เวลาเก็บเป็นนาทีไว้แล้ว)
+        bucket = self.__reservations_by_table_date.get((table_id, date_str), ())
+        for reservation in bucket:
+            if reservation.status == ReservationStatus.PENDING:
+                if new_start < reservation.end_minute and new_end > reservation.start_minute:
+                    return False
         return True
 
     def __validate_active_quota(self, customer_id, tier):
         active_count = 0
-        for reservation in self.__reservations:
-            if reservation.customer_id == customer_id:
-                if reservation.status == ReservationStatus.PENDING:
-                    active_count += 1
+        for reservation in self.__reservations_by_customer.get(customer_id, ()):
+            if reservation.status == ReservationStatus.PENDING:
+                active_count += 1
 
         # กำหนดโควตาตามระดับสมาชิก
-        max_quota = 1
-        if tier == MemberTier.BRONZE:
-            max_quota = 1
-        elif tier == MemberTier.SILVER:
-            max_quota = 2
-        elif tier == MemberTier.GOLD:
-            max_quota = 3
-        elif tier == MemberTier.PLATINUM:
-            max_quota = 4
+        max_quota = _ACTIVE_QUOTA_BY_TIER.get(tier, _DEFAULT_ACTIVE_QUOTA)
 
         if active_count >= max_quota:
             raise ValueError(
                 f"Active booking quota exceeded. Maximum allowed for your tier is {max_quota}."
             )
 
-    def __validate_advance_booking(self, date_str, tier):
-        try:
-            reservation_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-        except ValueError as e:
-            raise ValueError("Invalid date format. Expected YYYY-MM-DD.")
-
+    def __validate_advance_booking(self, reservation_date, tier):
         today = self.get_time().date()
         days_advance = (reservation_date - today).days
 
         if days_advance < 0:
             raise ValueError("Cannot make a reservation in the past.")
 
-        max_adv_days = 5
-        if tier == MemberTier.NONE_TIER:
-            max_adv_days = 5
-        if tier == MemberTier.BRONZE:
-            max_adv_days = 5
-        elif tier == MemberTier.SILVER:
-            max_adv_days = 14
-        elif tier == MemberTier.GOLD:
-            max_adv_days = 21
-        elif tier == MemberTier.PLATINUM:
-            max_adv_days = 30
+        max_adv_days = _ADVANCE_DAYS_BY_TIER.get(tier, _DEFAULT_ADVANCE_DAYS)
 
         if days_advance > max_adv_days:
             raise ValueError(
                 f"Maximum advance booking exceeded. Your tier allows up to {max_adv_days} days."
             )
 
-    def __validate_duration(self, start_time, end_time, tier):
-        try:
-            start_dt = datetime.strptime(start_time, "%H:%M")
-            end_dt = datetime.strptime(end_time, "%H:%M")
-        except ValueError:
-            raise ValueError("Invalid time format. Expected HH:MM.")
-
-        duration_hrs = (end_dt - start_dt).total_seconds() / 3600
+    def __validate_duration(self, start_minute, end_minute, tier):
+        duration_hrs = (end_minute - start_minute) / 60
 
         if duration_hrs <= 0:
             raise ValueError(
                 "End time must be after start time.")
 
-        max_dur_hrs = 2
-        if tier == MemberTier.BRONZE:
-            max_dur_hrs = 2
-        elif tier == MemberTier.SILVER:
-            max_dur_hrs = 3.5
-        elif tier == MemberTier.GOLD:
-            max_dur_hrs = 7
-        elif tier == MemberTier.PLATINUM:
-            max_dur_hrs = 999
+        max_dur_hrs = _DURATION_HOURS_BY_TIER.get(tier, _DEFAULT_DURATION_HOURS)
 
         if duration_hrs > max_dur_hrs:
             limit_str = (
@@ -703,19 +787,15 @@ class CafeSystem:
                 f"Maximum duration exceeded. Your tier allows up to {limit_str} per session."
             )
 
-    def __validate_minimum_lead_time(self, date_str, start_time):
-        try:
-            reservation_time = datetime.strptime(
-                f"{date_str} {start_time}", "%Y-%m-%d %H:%M"
-            )
-        except ValueError:
-            raise ValueError(
-                "Invalid date/time format. Expected YYYY-MM-DD and HH:MM.")
+    def __validate_minimum_lead_time(self, reservation_date, start_minute):
+        # วันที่และเวลาถูก parse มาแล้วใน make_reservation
+        reservation_time = datetime(
+            reservation_date.year, reservation_date.month, reservation_date.day
+        ) + timedelta(minutes=start_minute)
 
         lead_time = reservation_time - self.get_time()
-        one_hour = timedelta(hours=1)
 
-        if lead_time < one_hour:
+        if lead_time < _MIN_LEAD_TIME:
             raise ValueError(
                 "Minimum lead time not met. Tables require at least 1 hour(s) advance booking."
             )
@@ -737,7 +817,7 @@ class CafeSystem:
         try:
             return cafe_branch.add_table(capacity)
         except (TypeError, ValueError) as e:
-            raise ValueError(f"Failed to add table: {e}")
+            raise ValueError(f"Failed to add table: {e}") from e
 
     def get_branch_tables(self, branch_id):
         validate_id(branch_id, ["BRCH"])
@@ -750,6 +830,7 @@ class CafeSystem:
 
     def update_reserved_tables(self):
         now = self.get_time()
+        no_show_cutoff = -_NO_SHOW_GRACE
         for reservation in self.__reservations:
             if reservation.status != ReservationStatus.PENDING:
                 continue
@@ -766,7 +847,7 @@ class CafeSystem:
                     continue  # Never overwrite an currently active play session
                 
                 # 🟢 No-Show Threshold Policy: 15 minutes
-                if time_diff < timedelta(minutes=-15):
+                if time_diff < no_show_cutoff:
                     # More than 15 mins late -> mark as NO_SHOW and free the table
                     self.update_table_status(reservation.table_id, TableStatus.AVAILABLE)
                     reservation.status = ReservationStatus.NO_SHOW
@@ -774,7 +855,7 @@ class CafeSystem:
                     continue # Move to next reservation
 
                 # Keep table RESERVED from 1 hour before, up until 15 mins after reservation time
-                if timedelta(minutes=-15) <= time_diff <= timedelta(hours=1):
+                if no_show_cutoff <= time_diff <= _RESERVED_HOLD_BEFORE:
                     self.update_table_status(reservation.table_id, TableStatus.RESERVED)
                 else:
                     # If outside the reservation window, ensure table is available if it was reserved by this reservation
@@ -795,13 +876,10 @@ class CafeSystem:
         if cafe_branch is None:
             raise ValueError("Cafe Branch not found")
 
-        available_tables = []
-        for table in cafe_branch.tables:
-            if table.status != TableStatus.AVAILABLE:
-                continue
-            if table.capacity >= required_capacity:
-                available_tables.append(table)
-        return available_tables
+        return [
+            table for table in cafe_branch.get_available_tables()
+            if table.capacity >= required_capacity
+        ]
 
     def update_table_status(self, table_id, status):
         validate_id(table_id, ["TABLE"])
@@ -811,7 +889,7 @@ class CafeSystem:
 
         # Find the branch that owns this table
         found_table = False
-        for branch in self.__cafe_branches:
+        for branch in self.__cafe_branches.values():
             table = branch.find_table_by_id(table_id)
             if table:
                 table.status = status
@@ -846,7 +924,7 @@ class CafeSystem:
                 name, genre, price, min_players, max_players, description
             )
         except (TypeError, ValueError) as e:
-            raise ValueError(f"Failed to add board game: {e}")
+            raise ValueError(f"Failed to add board game: {e}") from e
 
     def get_branch_board_games(self, branch_id):
         validate_id(branch_id, ["BRCH"])
@@ -861,7 +939,7 @@ class CafeSystem:
         validate_id(board_game_id, ["BG"])
 
         # Iterate through all branches to find the board game
-        for branch in self.__cafe_branches:
+        for branch in self.__cafe_branches.values():
             board_game = branch.find_board_game_by_id(board_game_id)
             if board_game:
                 return board_game
@@ -900,7 +978,7 @@ class CafeSystem:
 
         # Find the branch that owns this board game
         found_branch = None
-        for branch in self.__cafe_branches:
+        for branch in self.__cafe_branches.values():
             bg = branch.find_board_game_by_id(board_game_id)
             if bg:
                 found_branch = branch
@@ -931,7 +1009,7 @@ class CafeSystem:
             cafe_branch.create_menu(new_menu)
             return new_menu
         except (TypeError, ValueError) as e:
-            raise ValueError(f"Failed to create menu: {e}")
+            raise ValueError(f"Failed to create menu: {e}") from e
 
     def create_menu_item_food_to_branch(self, branch_id, name, price, description="", requester_id=None):
         self.__authorize(requester_id, [Owner, Manager])
@@ -944,7 +1022,7 @@ class CafeSystem:
         try:
             return cafe_branch.create_menu_item_food(name, price, description)
         except (TypeError, ValueError) as e:
-            raise ValueError(f"Failed to create food item: {e}")
+            raise ValueError(f"Failed to create food item: {e}") from e
 
     def create_menu_item_drink_to_branch(
         self, branch_id, name, price, cup_size, description="", requester_id=None
@@ -961,7 +1039,7 @@ class CafeSystem:
                 name, price, cup_size, description
             )
         except (TypeError, ValueError) as e:
-            raise ValueError(f"Failed to create drink item: {e}")
+            raise ValueError(f"Failed to create drink item: {e}") from e
 
     def get_branch_menu(self, branch_id):
         validate_id(branch_id, ["BRCH"])
@@ -999,7 +1077,7 @@ class CafeSystem:
         validate_id(menu_item_id, ["FOOD", "DRINK"])
 
         # Iterate through all branches to find the menu item
-        for branch in self.__cafe_branches:
+        for branch in self.__cafe_branches.values():
             menu_item = branch.find_menu_item_by_id(menu_item_id)
             if menu_item:
                 return menu_item
@@ -1011,7 +1089,7 @@ class CafeSystem:
 
         # Find the branch that owns this menu item
         found_branch = None
-        for branch in self.__cafe_branches:
+        for branch in self.__cafe_branches.values():
             menu_item = branch.find_menu_item_by_id(menu_item_id)
             if menu_item:
                 found_branch = branch
@@ -1034,7 +1112,7 @@ class CafeSystem:
 
         # Find the branch that owns this menu item
         found_branch = None
-        for branch in self.__cafe_branches:
+        for branch in self.__cafe_branches.values():
             menu_item = branch.find_menu_item_by_id(menu_item_id)
             if menu_item:
                 found_branch = branch
@@ -1047,7 +1125,7 @@ class CafeSystem:
             found_branch.update_menu_item_by_id(
                 menu_item_id, name, price, description)
         except (TypeError, ValueError) as e:
-            raise ValueError(f"Failed to update menu item: {e}")
+            raise ValueError(f"Failed to update menu item: {e}") from e
 
     # / ════════════════════════════════════════════════════════════════
     # \ GAME SESSION - CHECK-IN
@@ -1084,7 +1162,7 @@ class CafeSystem:
         if now < reservation.reservation_time:
             raise ValueError("Too early to check-in")
 
-        late_limit = reservation.reservation_time + timedelta(minutes=15)
+        late_limit = reservation.reservation_time + _NO_SHOW_GRACE
         if now > late_limit:
             reservation.status = ReservationStatus.NO_SHOW
             raise ValueError(
@@ -1105,7 +1183,7 @@ class CafeSystem:
                 # Get bill preview for staff
                 try:
                     total_amount = self.get_active_bill(active_session.session_id, current_time=now)["total_amount"]
-                except Exception as e:
+                except ValueError:
                     total_amount = 0.0
                 raise ValueError(
                     f"FORCE CHECKOUT REQUIRED: Table {table.table_id} is occupied by expired session {active_session.session_id}. "
@@ -1138,7 +1216,7 @@ class CafeSystem:
 
             return session
         except (TypeError, ValueError) as e:
-            raise ValueError(f"Failed to create play session: {e}")
+            raise ValueError(f"Failed to create play session: {e}") from e
 
     def check_in(
         self,
@@ -1153,14 +1231,7 @@ class CafeSystem:
         elif isinstance(start_time, datetime):
             actual_start = start_time
         else:
-            parsed = None
-            for fmt in ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%dT%H:%M",
-                        "%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M"):
-                try:
-                    parsed = datetime.strptime(start_time, fmt)
-                    break
-                except ValueError:
-                    continue
+            parsed = parse_datetime_str(start_time)
             if parsed is None:
                 raise ValueError(
                     "start_time format invalid. Use 'YYYY-MM-DD HH:MM' or ISO format")
@@ -1183,10 +1254,15 @@ class CafeSystem:
             raise ValueError("Cafe Branch not found")
 
         if table_id == "auto":
-            tables = self.search_available_table(branch_id, player_amount)
-            if not tables:
+            # update_reserved_tables รันไปแล้วด้านบน เลือกโต๊ะว่างที่เล็กที่สุดในรอบเดียว
+            table = None
+            for candidate in branch.get_available_tables():
+                if candidate.capacity < player_amount:
+                    continue
+                if table is None or candidate.capacity < table.capacity:
+                    table = candidate
+            if table is None:
                 raise ValueError("No available table")
-            table = min(tables, key=lambda t: t.capacity)
         else:
             validate_id(table_id, ["TABLE"])
 
@@ -1198,7 +1274,7 @@ class CafeSystem:
                 if active_session and active_session.check_time_up(actual_start):
                     try:
                         total_amount = self.get_active_bill(active_session.session_id, current_time=actual_start)["total_amount"]
-                    except:
+                    except ValueError:
                         total_amount = 0.0
                     raise ValueError(
                         f"FORCE CHECKOUT REQUIRED: Table {table.table_id} is occupied by expired session {active_session.session_id}. "
@@ -1244,7 +1320,7 @@ class CafeSystem:
             branch.add_play_session(session)
             return session
         except (TypeError, ValueError) as e:
-            raise ValueError(f"Failed to create check-in session: {e}")
+            raise ValueError(f"Failed to create check-in session: {e}") from e
 
     # / ════════════════════════════════════════════════════════════════
     # \ GAME SESSION - JOIN
@@ -1259,7 +1335,7 @@ class CafeSystem:
 
         # Find the branch that owns this table/session
         cafe_branch = None
-        for branch in self.__cafe_branches:
+        for branch in self.__cafe_branches.values():
             if any_id.startswith("TABLE") and branch.find_table_by_id(any_id):
                 cafe_branch = branch
                 break
@@ -1309,7 +1385,7 @@ class CafeSystem:
                 
             return True
         except (TypeError, ValueError) as e:
-            raise ValueError(f"Failed to join session: {e}")
+            raise ValueError(f"Failed to join session: {e}") from e
 
     # / ════════════════════════════════════════════════════════════════
     # \ GAME SESSION - BORROW BOARD GAME
@@ -1320,7 +1396,7 @@ class CafeSystem:
 
         # Find the branch that owns this table/session
         cafe_branch = None
-        for branch in self.__cafe_branches:
+        for branch in self.__cafe_branches.values():
             if any_id.startswith("TABLE") and branch.find_table_by_id(any_id):
                 cafe_branch = branch
                 break
@@ -1353,7 +1429,7 @@ class CafeSystem:
             board_game.status = BoardGameStatus.IN_USE
             return board_game
         except (TypeError, ValueError) as e:
-            raise ValueError(f"Failed to borrow board game: {e}")
+            raise ValueError(f"Failed to borrow board game: {e}") from e
 
     def return_board_game(self, any_id, board_game_id, is_damaged=False):
         validate_id(any_id, ["TABLE", "PS"])
@@ -1361,7 +1437,7 @@ class CafeSystem:
 
         # Find the branch that owns this table/session
         cafe_branch = None
-        for branch in self.__cafe_branches:
+        for branch in self.__cafe_branches.values():
             if any_id.startswith("TABLE") and branch.find_table_by_id(any_id):
                 cafe_branch = branch
                 break
@@ -1380,7 +1456,7 @@ class CafeSystem:
         if board_game is None:
             raise ValueError("Board Game not found")
 
-        if board_game_id not in play_session.current_board_games_id:
+        if not play_session.has_board_game_id(board_game_id):
             raise ValueError("This session did not borrow this board game")
 
         try:
@@ -1393,7 +1469,7 @@ class CafeSystem:
             play_session.remove_board_games_id(board_game_id)
             return board_game
         except (TypeError, ValueError) as e:
-            raise ValueError(f"Failed to return board game: {e}")
+            raise ValueError(f"Failed to return board game: {e}") from e
 
     def maintenance_board_game(self, board_game_id, requester_id=None):
         self.__authorize(requester_id, [Owner, Manager, Staff])
@@ -1401,7 +1477,7 @@ class CafeSystem:
 
         # Find the branch that owns this board game
         cafe_branch = None
-        for branch in self.__cafe_branches:
+        for branch in self.__cafe_branches.values():
             bg = branch.find_board_game_by_id(board_game_id)
             if bg:
                 cafe_branch = branch
@@ -1415,7 +1491,7 @@ class CafeSystem:
             raise ValueError("Board Game not found")
 
         for session in cafe_branch.get_play_sessions():
-            if board_game_id in session.current_board_games_id:
+            if session.has_board_game_id(board_game_id):
                 raise ValueError("Board Game is currently in use")
 
         board_game.status = BoardGameStatus.MAINTENANCE
@@ -1430,7 +1506,7 @@ class CafeSystem:
 
         # Find the branch that owns this table/session
         cafe_branch = None
-        for branch in self.__cafe_branches:
+        for branch in self.__cafe_branches.values():
             if any_id.startswith("TABLE") and branch.find_table_by_id(any_id):
                 cafe_branch = branch
                 break
@@ -1456,7 +1532,7 @@ class CafeSystem:
         try:
             return play_session.take_order(menu_item)
         except (TypeError, ValueError) as e:
-            raise ValueError(f"Failed to take order: {e}")
+            raise ValueError(f"Failed to take order: {e}") from e
 
     def get_play_session_orders(self, any_id: str):
 
@@ -1464,7 +1540,7 @@ class CafeSystem:
 
         # Find the branch that owns this table/session
         cafe_branch = None
-        for branch in self.__cafe_branches:
+        for branch in self.__cafe_branches.values():
             if any_id.startswith("TABLE") and branch.find_table_by_id(any_id):
                 cafe_branch = branch
                 break
@@ -1482,7 +1558,7 @@ class CafeSystem:
 
         # Find the branch that owns this session
         cafe_branch = None
-        for branch in self.__cafe_branches:
+        for branch in self.__cafe_branches.values():
             if branch.find_play_session_by_id(play_session_id):
                 cafe_branch = branch
                 break
@@ -1494,15 +1570,14 @@ class CafeSystem:
         if play_session is None:
             raise ValueError("Play Session not found")
 
-        for order in play_session.current_order:
-            if order.order_id == order_id:
-                try:
-                    order.set_order_status(session_status)
-                except (TypeError, ValueError) as e:
-                    raise ValueError(f"Failed to update order: {e}")
-                return
+        order = play_session.find_order_by_id(order_id)
+        if order is None:
+            raise ValueError("Order not found")
 
-        raise ValueError("Order not found")
+        try:
+            order.set_order_status(session_status)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Failed to update order: {e}") from e
 
     def update_order_preparing(self, play_session_id, order_id):
         self.update_order(play_session_id, order_id, OrderStatus.PREPARING)
@@ -1516,7 +1591,7 @@ class CafeSystem:
 
         # Find the branch that owns this session
         cafe_branch = None
-        for branch in self.__cafe_branches:
+        for branch in self.__cafe_branches.values():
             if (play_session_id.startswith("PS") and branch.find_play_session_by_id(play_session_id)) or \
                (play_session_id.startswith("TABLE") and branch.find_play_session_by_table_id(play_session_id)):
                 cafe_branch = branch
@@ -1529,16 +1604,14 @@ class CafeSystem:
         if play_session is None:
             raise ValueError("Play Session not found")
 
-        for order in play_session.current_order:
-            if order.order_id == order_id:
-                if order.status == OrderStatus.SERVED:
-                    raise ValueError(
-                        "Cannot cancel an order that has already been served")
-                self.update_order(play_session_id, order_id,
-                                  OrderStatus.CANCELLED)
-                return
+        order = play_session.find_order_by_id(order_id)
+        if order is None:
+            raise ValueError("Order not found")
 
-        raise ValueError("Order not found")
+        if order.status == OrderStatus.SERVED:
+            raise ValueError(
+                "Cannot cancel an order that has already been served")
+        self.update_order(play_session_id, order_id, OrderStatus.CANCELLED)
 
     # / ════════════════════════════════════════════════════════════════
     # \ GAME SESSION - CHECK-OUT
@@ -1548,16 +1621,27 @@ class CafeSystem:
 
         if not isinstance(method_type, str):
             raise ValueError("method_type must be a string")
-        if method_type not in ["cash", "card", "online"]:
+        if method_type not in PAYMENT_METHOD_BUILDERS:
             raise ValueError(
                 f"Invalid payment method: '{method_type}'. Allowed: 'cash', 'card', 'online'"
             )
 
-        actual_end_time = end_time if end_time is not None else self.get_time()
+        # แปลง end_time ให้เป็น datetime ก่อนแก้ไข state ใด ๆ (ไม่ให้ checkout ค้างครึ่งทาง)
+        if end_time is None:
+            actual_end_time = self.get_time()
+        elif isinstance(end_time, datetime):
+            actual_end_time = end_time
+        elif isinstance(end_time, str):
+            actual_end_time = parse_datetime_str(end_time)
+            if actual_end_time is None:
+                raise ValueError(
+                    "end_time format invalid. Use 'YYYY-MM-DD HH:MM' or ISO format")
+        else:
+            raise ValueError("end_time must be a datetime or a datetime string")
 
         # Find the branch - check both active sessions and tables
         cafe_branch = None
-        for branch in self.__cafe_branches:
+        for branch in self.__cafe_branches.values():
             if any_id.startswith("TABLE") and branch.find_table_by_id(any_id):
                 cafe_branch = branch
                 break
@@ -1600,7 +1684,7 @@ class CafeSystem:
                     break
         except Exception as e:
             play_session.end_time = None  # rollback
-            raise ValueError(f"Error calculating bill: {e}")
+            raise ValueError(f"Error calculating bill: {e}") from e
 
         table = cafe_branch.find_table_by_id(play_session.table_id)
 
@@ -1656,15 +1740,15 @@ class CafeSystem:
             for bg_id in list(session.current_board_games_id):
                 try:
                     self.return_board_game(session_id, bg_id, is_damaged=False)
-                except:
+                except ValueError:
                     pass
             
             # Auto-cancel pending/preparing orders
             for order in list(session.current_order):
-                if order.status in [OrderStatus.PENDING, OrderStatus.PREPARING]:
+                if order.status in _OPEN_ORDER_STATUSES:
                     try:
                         self.update_order_cancel(session_id, order.order_id)
-                    except:
+                    except ValueError:
                         pass
 
         # 3. Perform regular checkout with the specified method and extra parameters
@@ -1679,51 +1763,16 @@ class CafeSystem:
         if not isinstance(method_type, str):
             raise ValueError("method_type must be a string")
 
-        if method_type == "cash":
-            try:
-                paid_amount = kwargs.get("paid_amount", total)
-                paid_amount = float(paid_amount)
-            except (TypeError, ValueError):
-                raise ValueError("paid_amount must be a valid number")
-
-            if paid_amount < total:
-                raise ValueError("Paid amount is not enough")
-
-            change = paid_amount - total
-            payment_method = Cash(paid_amount)
-            payment_method.change = change
-
-        elif method_type == "card":
-            try:
-                payment_method = CreditCard(
-                    kwargs["card_number"], kwargs["expiry_date"], kwargs["cvv"]
-                )
-            except KeyError as e:
-                raise ValueError(
-                    f"Missing required field for card payment: {e}")
-            except (TypeError, ValueError) as e:
-                raise ValueError(f"Invalid card payment details: {e}")
-
-        elif method_type == "online":
-            try:
-                payment_method = OnlinePayment(kwargs["email"])
-            except KeyError:
-                raise ValueError(
-                    "Missing required field for online payment: email")
-            except (TypeError, ValueError) as e:
-                raise ValueError(f"Invalid online payment details: {e}")
-
-        else:
+        build_method = PAYMENT_METHOD_BUILDERS.get(method_type)
+        if build_method is None:
             raise ValueError(
                 f"Invalid payment method: '{method_type}'. Allowed: 'cash', 'card', 'online'"
             )
+        payment_method = build_method(total, kwargs)
 
-        try:
-            if payment_method.validate_method():
-                new_payment = Payment(total, payment_method)
-                return new_payment
-        except Exception as e:
-            raise ValueError(f"Payment validation failed: {e}")
+        if payment_method.validate_method():
+            return Payment(total, payment_method)
+        raise ValueError("Invalid payment method")
 
     def get_active_bill(self, session_id, current_time=None):
         play_session = self.find_play_session_by_id(session_id)
@@ -1747,7 +1796,7 @@ class CafeSystem:
 
     def bill_history(self, session_id: str) -> list:
         validate_id(session_id, ["PS"])
-        for branch in self.__cafe_branches:
+        for branch in self.__cafe_branches.values():
             for session in branch.get_play_sessions_history():
                 if session.session_id == session_id:
                     return self.__calculate_bill(session)
@@ -1756,7 +1805,7 @@ class CafeSystem:
     def bill_history_by_person(self, person_id: str) -> list:
         validate_id(person_id, ["MEMBER", "WALK", "OWNER", "MANAGER", "STAFF"])
         items = []
-        for branch in self.__cafe_branches:
+        for branch in self.__cafe_branches.values():
             for session in branch.get_play_sessions_history():
                 if person_id in session.current_players_id:
                     items.append(
@@ -1774,8 +1823,7 @@ class CafeSystem:
             return True
         
         # If no owner exists in the system, allow anyone to bootstrap
-        owners = [p for p in self.__person if isinstance(p, Owner)]
-        if not owners:
+        if not any(isinstance(p, Owner) for p in self.__person):
             return True
 
         try:
@@ -1783,14 +1831,26 @@ class CafeSystem:
             if any(isinstance(person, role) for role in allowed_roles):
                 return True
             raise PermissionError(f"User {requester_id} is not authorized for this action.")
-        except ValueError:
-            raise PermissionError(f"User {requester_id} not found.")
+        except ValueError as e:
+            raise PermissionError(f"User {requester_id} not found.") from e
+
+    @staticmethod
+    def __person_name_key(name):
+        return name.lower() if isinstance(name, str) else name
+
+    def __unindex_person_name(self, person, key):
+        bucket = self.__person_by_name.get(key)
+        if bucket is None or person not in bucket:
+            return
+        bucket.remove(person)
+        if not bucket:
+            del self.__person_by_name[key]
 
     def __is_person_in_active_session(self, person_id: str) -> bool:
         if person_id.startswith("WALK-"):
             return False
         
-        for branch in self.__cafe_branches:
+        for branch in self.__cafe_branches.values():
             for session in branch.get_play_sessions():
                 if person_id in session.current_players_id:
                     return True
@@ -1799,13 +1859,19 @@ class CafeSystem:
     def __check_future_reservations(self, table_id, current_time=None):
         if current_time is None:
             current_time = self.get_time()
-        
 
-        for res in self.__reservations:
-            if res.table_id == table_id and res.status == ReservationStatus.PENDING:
-                time_diff = (res.reservation_time - current_time).total_seconds() / 60.0
-                if -15 <= time_diff <= 30: # From 15 mins late to 30 mins in future
-                    return True
+        # ช่วง -15 ถึง +30 นาทีอาจคร่อมเที่ยงคืน จึงดูทั้งสองวันที่เกี่ยวข้อง
+        window_dates = {
+            (current_time - timedelta(minutes=15)).strftime("%Y-%m-%d"),
+            (current_time + timedelta(minutes=30)).strftime("%Y-%m-%d"),
+        }
+        for date_str in window_dates:
+            bucket = self.__reservations_by_table_date.get((table_id, date_str), ())
+            for res in bucket:
+                if res.status == ReservationStatus.PENDING:
+                    time_diff = (res.reservation_time - current_time).total_seconds() / 60.0
+                    if -15 <= time_diff <= 30: # From 15 mins late to 30 mins in future
+                        return True
         return False
 
     def __validate_session_time(self, play_session, current_time=None):
@@ -1819,7 +1885,7 @@ class CafeSystem:
 
     def __calculate_bill(self, session) -> list:
         cafe_branch = None
-        for branch in self.__cafe_branches:
+        for branch in self.__cafe_branches.values():
             if any(s.session_id == session.session_id for s in branch.get_play_sessions()):
                 cafe_branch = branch
                 break
@@ -1898,13 +1964,20 @@ class CafeBranch:
         self.__name = name
         self.__location = location
         self.__tables = []
+        self.__table_by_id = {}
+        self.__available_table_ids = {}  # ใช้ dict เป็น ordered set ของ table id ที่ว่าง
         self.__board_games = []
+        self.__board_game_by_id = {}
         self.__menu_list = MenuList()
-        self.__staff_id = []
+        self.__staff_id = {}  # ใช้ dict เป็น ordered set ของ staff id
         self.__manager_id = None
         self.__owner_id = None
         self.__play_sessions = []
         self.__play_sessions_history = []
+        self.__tables_view = None
+        self.__board_games_view = None
+        self.__play_sessions_view = None
+        self.__play_sessions_history_view = None
 
     # / ════════════════════════════════════════════════════════════════
     # - Getters
@@ -1928,11 +2001,15 @@ class CafeBranch:
 
     @property
     def tables(self):
-        return self.__tables.copy()
+        if self.__tables_view is None:
+            self.__tables_view = tuple(self.__tables)
+        return self.__tables_view
 
     @property
     def board_games(self):
-        return self.__board_games.copy()
+        if self.__board_games_view is None:
+            self.__board_games_view = tuple(self.__board_games)
+        return self.__board_games_view
 
     @property
     def total_tables(self):
@@ -1966,16 +2043,30 @@ class CafeBranch:
     def add_table(self, capacity):
         new_table = Table(capacity)
         self.__tables.append(new_table)
+        self.__tables_view = None
+        self.__table_by_id[new_table.table_id] = new_table
+        new_table.set_status_listener(self.__on_table_status_change)
+        self.__on_table_status_change(new_table)
         return new_table
 
     def get_tables(self):
-        return self.__tables.copy()
+        return self.tables
 
     def find_table_by_id(self, table_id):
-        for table in self.__tables:
-            if table.table_id == table_id:
-                return table
-        return None
+        return self.__table_by_id.get(table_id)
+
+    def get_available_tables(self):
+        # เรียงตามลำดับที่โต๊ะกลับมาว่าง (ตอนเริ่มคือลำดับที่เพิ่มโต๊ะ) ไม่ต้อง sort
+        return [
+            self.__table_by_id[table_id]
+            for table_id in self.__available_table_ids
+        ]
+
+    def __on_table_status_change(self, table):
+        if table.status == TableStatus.AVAILABLE:
+            self.__available_table_ids[table.table_id] = None
+        else:
+            self.__available_table_ids.pop(table.table_id, None)
 
     # / ════════════════════════════════════════════════════════════════
     # \ BOARD GAME
@@ -1987,16 +2078,15 @@ class CafeBranch:
             name, genre, price, min_players, max_players, description
         )
         self.__board_games.append(new_board_game)
+        self.__board_game_by_id[new_board_game.game_id] = new_board_game
+        self.__board_games_view = None
         return new_board_game
 
     def get_board_games(self):
-        return self.__board_games.copy()
+        return self.board_games
 
     def find_board_game_by_id(self, board_game_id):
-        for board_game in self.__board_games:
-            if board_game.game_id == board_game_id:
-                return board_game
-        return None
+        return self.__board_game_by_id.get(board_game_id)
 
     def search_board_game_by_min_players(self, min_players):
         return [bg for bg in self.__board_games
@@ -2007,11 +2097,11 @@ class CafeBranch:
                 if bg.min_players <= max_players <= bg.max_players]
 
     def remove_board_game_by_id(self, board_game_id):
-        self.__board_games = [
-            board_game
-            for board_game in self.__board_games
-            if board_game.game_id != board_game_id
-        ]
+        board_game = self.__board_game_by_id.pop(board_game_id, None)
+        if board_game is None:
+            return
+        self.__board_games.remove(board_game)
+        self.__board_games_view = None
 
     # / ════════════════════════════════════════════════════════════════
     # \ MENU
@@ -2080,7 +2170,7 @@ class CafeBranch:
             menu_item.price = price
             menu_item.description = description
         except (TypeError, ValueError) as e:
-            raise ValueError(f"Cannot update menu item: {e}")
+            raise ValueError(f"Cannot update menu item: {e}") from e
 
     # / ════════════════════════════════════════════════════════════════
     # \ ORDER
@@ -2095,15 +2185,20 @@ class CafeBranch:
     # / ════════════════════════════════════════════════════════════════
     # \ PLAY SESSION
     def get_play_sessions_history(self):
-        return self.__play_sessions_history.copy()
+        if self.__play_sessions_history_view is None:
+            self.__play_sessions_history_view = tuple(self.__play_sessions_history)
+        return self.__play_sessions_history_view
 
     def add_play_session(self, play_session):
         if not isinstance(play_session, PlaySession):
             raise TypeError("Type Error : must be an instance of PlaySession")
         self.__play_sessions.append(play_session)
+        self.__play_sessions_view = None
 
     def get_play_sessions(self):
-        return self.__play_sessions.copy()
+        if self.__play_sessions_view is None:
+            self.__play_sessions_view = tuple(self.__play_sessions)
+        return self.__play_sessions_view
 
     def find_play_session_by_id(self, any_id):
         try:
@@ -2119,8 +2214,8 @@ class CafeBranch:
                 raise ValueError(
                     "Invalid ID : ID must be start with PS or TABLE")
             return None
-        except (AttributeError, TypeError):
-            raise ValueError("Invalid ID format")
+        except (AttributeError, TypeError) as e:
+            raise ValueError("Invalid ID format") from e
 
     def find_play_session_history_by_id(self, any_id):
         try:
@@ -2136,14 +2231,15 @@ class CafeBranch:
                 raise ValueError(
                     "Invalid ID : ID must be start with PS or TABLE")
             return None
-        except (AttributeError, TypeError):
-            raise ValueError("Invalid ID format")
+        except (AttributeError, TypeError) as e:
+            raise ValueError("Invalid ID format") from e
 
     def remove_play_session_by_id(self, play_session_id):
         play_session = self.find_play_session_by_id(play_session_id)
         if play_session is None:
             raise ValueError("Invalid ID : Play Session not found")
         self.__play_sessions.remove(play_session)
+        self.__play_sessions_view = None
 
     def end_play_session(self, play_session_id, end_time=None):
         if end_time is None:
@@ -2157,8 +2253,10 @@ class CafeBranch:
             play_session.end_time = end_time
             self.__play_sessions_history.append(play_session)
             self.__play_sessions.remove(play_session)
+            self.__play_sessions_view = None
+            self.__play_sessions_history_view = None
         except (TypeError, ValueError) as e:
-            raise ValueError(f"Failed to end play session: {e}")
+            raise ValueError(f"Failed to end play session: {e}") from e
 
     # / ════════════════════════════════════════════════════════════════
     # \ STAFF
@@ -2166,15 +2264,15 @@ class CafeBranch:
     def add_staff(self, staff):
         if not isinstance(staff, Staff):
             raise TypeError("Type Error : must be an instance of Staff")
-        self.__staff_id.append(staff.user_id)
+        self.__staff_id[staff.user_id] = None
 
     def get_staff(self):
-        return self.__staff_id.copy()
+        return list(self.__staff_id)
 
     def remove_staff_by_id(self, staff_id):
         if staff_id not in self.__staff_id:
             raise ValueError("Invalid ID : ID does not exist")
-        self.__staff_id.remove(staff_id)
+        del self.__staff_id[staff_id]
 
     # / ════════════════════════════════════════════════════════════════
     # \ MANAGER
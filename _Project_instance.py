@@ -42,163 +42,46 @@ system.create_table_to_branch("BRCH-00000", 10, requester_id="system")
 
 # / ════════════════════════════════════════════════════════════════
 
-system.create_board_game_to_branch(
-    "BRCH-00000",
-    "Uno",
-    "classic card game",
-    100.00,
-    2,
-    10,
-    "A card game where players take turns matching a card in their hand with the current card shown on top of the deck either by color or number.",
-    requester_id="system"
-)
-system.create_board_game_to_branch(
-    "BRCH-00000",
-    "Monopoly",
-    "classic board game",
-    200.00,
-    2,
-    6,
-    "A board game where players buy and sell properties, collect rent, and try to bankrupt other players by landing on their properties.",
-    requester_id="system"
-)
-system.create_board_game_to_branch(
-    "BRCH-00000",
-    "Scrabble",
-    "classic word game",
-    100.00,
-    2,
-    4,
-    "A word game where players take turns to form words from a set of letters.",
-    requester_id="system"
-)
-
-system.create_board_game_to_branch(
-    "BRCH-00000",
-    "Catan",
-    "Strategy",
-    600,
-    3,
-    4,
-    "Build settlements and trade resources.",
-    requester_id="system"
-)
-
-system.create_board_game_to_branch(
-    "BRCH-00000",
-    "Avalon",
-    "Social Deduction",
-    350,
-    5,
-    10,
-    "Find the minions of Mordred.",
-    requester_id="system"
-)
-
-system.create_board_game_to_branch(
-    "BRCH-00000",
-    "Exploding Kittens",
-    "Party",
-    300,
-    2,
-    5,
-    "Don't get exploded by the kitten!",
-    requester_id="system"
-)
-
-system.create_board_game_to_branch(
-    "BRCH-00000",
-    "Root",
-    "Strategy",
-    900,
-    2,
-    4,
-    "Asymmetric warfare in the forest.",
-    requester_id="system"
-)
+BRANCH_1_BOARD_GAMES = (
+    # (name, genre, price, min_players, max_players, description)
+    ("Uno", "classic card game", 100.00, 2, 10, "A card game where players take turns matching a card in their hand with the current card shown on top of the deck either by color or number."),
+    ("Monopoly", "classic board game", 200.00, 2, 6, "A board game where players buy and sell properties, collect rent, and try to bankrupt other players by landing on their properties."),
+    ("Scrabble", "classic word game", 100.00, 2, 4, "A word game where players take turns to form words from a set of letters."),
+    ("Catan", "Strategy", 600, 3, 4, "Build settlements and trade resources."),
+    ("Avalon", "Social Deduction", 350, 5, 10, "Find the minions of Mordred."),
+    ("Exploding Kittens", "Party", 300, 2, 5, "Don't get exploded by the kitten!"),
+    ("Root", "Strategy", 900, 2, 4, "Asymmetric warfare in the forest."),
+)
+for game in BRANCH_1_BOARD_GAMES:
+    system.create_board_game_to_branch("BRCH-00000", *game, requester_id="system")
 
 # / ════════════════════════════════════════════════════════════════
 
 system.create_menu_to_branch("BRCH-00000")
 
 # เพิ่มเมนูอาหารลงในระบบ
-system.create_menu_item_food_to_branch(
-    "BRCH-00000",
-    "Spicy BBQ Wings",
-    129,
-    "Deep-fried wings with spicy BBQ sauce",
-    requester_id="system"
-)
-system.create_menu_item_food_to_branch(
-    "BRCH-00000",
-    "Larb French Fries",
-    89,
-    "French fries with spicy Larb seasoning",
-    requester_id="system"
-)
-system.create_menu_item_food_to_branch(
-    "BRCH-00000",
-    "Spicy Tuna Sandwich",
-    79,
-    "Tuna sandwich with a spicy Sriracha kick",
-    requester_id="system"
-)
-system.create_menu_item_food_to_branch(
-    "BRCH-00000",
-    "Crispy Gyoza Chili Oil",
-    95,
-    "Fried gyoza served with spicy chili oil",
-    requester_id="system"
-)
-system.create_menu_item_food_to_branch(
-    "BRCH-00000",
-    "Cheesy Nachos Jalapeno",
-    115,
-    "Nachos with cheese and spicy jalapenos",
-    requester_id="system"
+BRANCH_1_FOODS = (
+    # (name, price, description)
+    ("Spicy BBQ Wings", 129, "Deep-fried wings with spicy BBQ sauce"),
+    ("Larb French Fries", 89, "French fries with spicy Larb seasoning"),
+    ("Spicy Tuna Sandwich", 79, "Tuna sandwich with a spicy Sriracha kick"),
+    ("Crispy Gyoza Chili Oil", 95, "Fried gyoza served with spicy chili oil"),
+    ("Cheesy Nachos Jalapeno", 115, "Nachos with cheese and spicy jalapenos"),
 )
+for item in BRANCH_1_FOODS:
+    system.create_menu_item_food_to_branch("BRCH-00000", *item, requester_id="system")
 
 # เพิ่มเมนูเครื่องดื่มลงในระบบ (พารามิเตอร์: branch_id, name, price, cup_size, description)
-system.create_menu_item_drink_to_branch(
-    "BRCH-00000",
-    "Thai Milk Tea",
-    55,
-    "M",
-    "Signature Thai iced tea",
-    requester_id="system"
-)
-system.create_menu_item_drink_to_branch(
-    "BRCH-00000",
-    "Pink Lemonade Soda",
-    65,
-    "L",
-    "Sparkling pink lemonade",
-    requester_id="system"
-)
-system.create_menu_item_drink_to_branch(
-    "BRCH-00000",
-    "Iced Matcha Latte",
-    75,
-    "M",
-    "Premium Japanese matcha with fresh milk",
-    requester_id="system"
-)
-system.create_menu_item_drink_to_branch(
-    "BRCH-00000",
-    "Lychee Rose Tea",
-    60,
-    "L",
-    "Refreshing lychee tea with rose aroma",
-    requester_id="system"
-)
-system.create_menu_item_drink_to_branch(
-    "BRCH-00000",
-    "Dark Chocolate Frappe",
-    85,
-    "M",
-    "Rich dark chocolate blended drink",
-    requester_id="system"
+BRANCH_1_DRINKS = (
+    # (name, price, cup_size, description)
+    ("Thai Milk Tea", 55, "M", "Signature Thai iced tea"),
+    ("Pink Lemonade Soda", 65, "L", "Sparkling pink lemonade"),
+    ("Iced Matcha Latte", 75, "M", "Premium Japanese matcha with fresh milk"),
+    ("Lychee Rose Tea", 60, "L", "Refreshing lychee tea with rose aroma"),
+    ("Dark Chocolate Frappe", 85, "M", "Rich dark chocolate blended drink"),
 )
+for item in BRANCH_1_DRINKS:
+    system.create_menu_item_drink_to_branch("BRCH-00000", *item, requester_id="system")
 
 # / ════════════════════════════════════════════════════════════════
 
@@ -225,194 +108,48 @@ system.create_table_to_branch("BRCH-00001", 4, requester_id="system") # was 8
 system.create_table_to_branch("BRCH-00001", 10, requester_id="system")
 
 # เพิ่มบอร์ดเกม 7 เกม
-system.create_board_game_to_branch(
-    "BRCH-00001",
-    "Ultimate Werewolf",
-    "Party",
-    300,
-    7,
-    35,
-    "A game of social deduction for large groups.",
-    requester_id="system"
-)
-system.create_board_game_to_branch(
-    "BRCH-00001",
-    "Exploding Kittens",
-    "Party",
-    350,
-    2,
-    5,
-    "A strategic, kitty-powered version of Russian Roulette.",
-    requester_id="system"
-)
-system.create_board_game_to_branch(
-    "BRCH-00001",
-    "Salem 1692",
-    "Social Deduction",
-    450,
-    4,
-    12,
-    "Hunt the witches before they take over the town of Salem.",
-    requester_id="system"
-)
-system.create_board_game_to_branch(
-    "BRCH-00001",
-    "Usagyuuun",
-    "Party",
-    300,
-    2,
-    6,
-    "A fun and fast-paced game featuring the energetic Usagyuuun characters.",
-    requester_id="system"
-)
-system.create_board_game_to_branch(
-    "BRCH-00001",
-    "Coup",
-    "Bluffing",
-    250,
-    2,
-    6,
-    "Bluff and deceive your way to power in this quick strategy game.",
-    requester_id="system"
-)
-system.create_board_game_to_branch(
-    "BRCH-00001",
-    "Sheriff of Nottingham",
-    "Bluffing",
-    500,
-    3,
-    5,
-    "Deceive and bribe the Sheriff to smuggle your goods into the city.",
-    requester_id="system"
-)
-system.create_board_game_to_branch(
-    "BRCH-00001",
-    "Cheese Thief",
-    "Social Deduction",
-    350,
-    4,
-    8,
-    "A quick-playing game where everyone tries to find who stole the cheese.",
-    requester_id="system"
-)
+BRANCH_2_BOARD_GAMES = (
+    # (name, genre, price, min_players, max_players, description)
+    ("Ultimate Werewolf", "Party", 300, 7, 35, "A game of social deduction for large groups."),
+    ("Exploding Kittens", "Party", 350, 2, 5, "A strategic, kitty-powered version of Russian Roulette."),
+    ("Salem 1692", "Social Deduction", 450, 4, 12, "Hunt the witches before they take over the town of Salem."),
+    ("Usagyuuun", "Party", 300, 2, 6, "A fun and fast-paced game featuring the energetic Usagyuuun characters."),
+    ("Coup", "Bluffing", 250, 2, 6, "Bluff and deceive your way to power in this quick strategy game."),
+    ("Sheriff of Nottingham", "Bluffing", 500, 3, 5, "Deceive and bribe the Sheriff to smuggle your goods into the city."),
+    ("Cheese Thief", "Social Deduction", 350, 4, 8, "A quick-playing game where everyone tries to find who stole the cheese."),
+)
+for game in BRANCH_2_BOARD_GAMES:
+    system.create_board_game_to_branch("BRCH-00001", *game, requester_id="system")
 
 system.create_menu_to_branch("BRCH-00001")
 # อาหารไทย 4 อย่าง
-system.create_menu_item_food_to_branch(
-    "BRCH-00001",
-    "Pad Thai Goong",
-    120,
-    "Stir-fried rice noodles with shrimp, tofu, and bean sprouts.",
-    requester_id="system"
-)
-system.create_menu_item_food_to_branch(
-    "BRCH-00001",
-    "Green Curry with Chicken",
-    150,
-    "Rich and spicy Thai green curry served with tender chicken.",
-    requester_id="system"
-)
-system.create_menu_item_food_to_branch(
-    "BRCH-00001",
-    "Basil Pork over Rice",
-    110,
-    "Spicy stir-fried minced pork with holy basil and a fried egg.",
-    requester_id="system"
-)
-system.create_menu_item_food_to_branch(
-    "BRCH-00001",
-    "Tom Yum Goong",
-    180,
-    "Famous Thai spicy and sour soup with succulent prawns.",
-    requester_id="system"
-)
-
-# ของกินเล่น 4 อย่าง
-system.create_menu_item_food_to_branch(
-    "BRCH-00001",
-    "Crispy Spring Rolls",
-    80,
-    "Golden fried vegetable spring rolls served with sweet chili sauce.",
-    requester_id="system"
-)
-system.create_menu_item_food_to_branch(
-    "BRCH-00001",
-    "Chicken Satay",
-    95,
-    "Grilled marinated chicken skewers served with peanut sauce.",
-    requester_id="system"
-)
-system.create_menu_item_food_to_branch(
-    "BRCH-00001",
-    "Fried Wontons",
-    70,
-    "Crispy fried wontons stuffed with seasoned minced pork.",
-    requester_id="system"
-)
-system.create_menu_item_food_to_branch(
-    "BRCH-00001",
-    "Spicy Pork Jerky",
-    90,
-    "Authentic Thai-style deep-fried marinated pork jerky.",
-    requester_id="system"
-)
+BRANCH_2_FOODS = (
+    # (name, price, description)
+    ("Pad Thai Goong", 120, "Stir-fried rice noodles with shrimp, tofu, and bean sprouts."),
+    ("Green Curry with Chicken", 150, "Rich and spicy Thai green curry served with tender chicken."),
+    ("Basil Pork over Rice", 110, "Spicy stir-fried minced pork with holy basil and a fried egg."),
+    ("Tom Yum Goong", 180, "Famous Thai spicy and sour soup with succulent prawns."),
+    # ของกินเล่น 4 อย่าง
+    ("Crispy Spring Rolls", 80, "Golden fried vegetable spring rolls served with sweet chili sauce."),
+    ("Chicken Satay", 95, "Grilled marinated chicken skewers served with peanut sauce."),
+    ("Fried Wontons", 70, "Crispy fried wontons stuffed with seasoned minced pork."),
+    ("Spicy Pork Jerky", 90, "Authentic Thai-style deep-fried marinated pork jerky."),
+)
+for item in BRANCH_2_FOODS:
+    system.create_menu_item_food_to_branch("BRCH-00001", *item, requester_id="system")
 
 # เครื่องดื่ม 7 อย่าง
-system.create_menu_item_drink_to_branch(
-    "BRCH-00001",
-    "Pink Milk (Nom Yen)",
-    45,
-    "M",
-    "Sweet and creamy Thai-style rose syrup milk.",
-    requester_id="system"
-)
-system.create_menu_item_drink_to_branch(
-    "BRCH-00001",
-    "Thai Iced Tea",
-    50,
-    "M",
-    "Classic Thai tea brewed and served with sweetened condensed milk.",
-    requester_id="system"
-)
-system.create_menu_item_drink_to_branch(
-    "BRCH-00001",
-    "Iced Matcha Green Tea",
-    55,
-    "M",
-    "Refreshing iced premium Japanese green tea with milk.",
-    requester_id="system"
-)
-system.create_menu_item_drink_to_branch(
-    "BRCH-00001",
-    "Iced Americano",
-    60,
-    "M",
-    "Bold and smooth espresso topped with water and ice.",
-    requester_id="system"
-)
-system.create_menu_item_drink_to_branch(
-    "BRCH-00001",
-    "Blue Hawaii Italian Soda",
-    55,
-    "L",
-    "Sparkling blue hawaii syrup mixed with refreshing soda.",
-    requester_id="system"
-)
-system.create_menu_item_drink_to_branch(
-    "BRCH-00001",
-    "Mineral Water",
-    20,
-    "S",
-    "Chilled bottled natural mineral water.",
-    requester_id="system"
-)
-system.create_menu_item_drink_to_branch(
-    "BRCH-00001",
-    "Iced Fresh Milk",
-    40,
-    "M",
-    "Pure, creamy, and chilled fresh milk.",
-    requester_id="system"
-)
+BRANCH_2_DRINKS = (
+    # (name, price, cup_size, description)
+    ("Pink Milk (Nom Yen)", 45, "M", "Sweet and creamy Thai-style rose syrup milk."),
+    ("Thai Iced Tea", 50, "M", "Classic Thai tea brewed and served with sweetened condensed milk."),
+    ("Iced Matcha Green Tea", 55, "M", "Refreshing iced premium Japanese green tea with milk."),
+    ("Iced Americano", 60, "M", "Bold and smooth espresso topped with water and ice."),
+    ("Blue Hawaii Italian Soda", 55, "L", "Sparkling blue hawaii syrup mixed with refreshing soda."),
+    ("Mineral Water", 20, "S", "Chilled bottled natural mineral water."),
+    ("Iced Fresh Milk", 40, "M", "Pure, creamy, and chilled fresh milk."),
+)
+for item in BRANCH_2_DRINKS:
+    system.create_menu_item_drink_to_branch("BRCH-00001", *item, requester_id="system")
 
 # | ════════════════════════════════════════════════════════════════════════════════════════════════════════════════════════════════
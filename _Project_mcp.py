@@ -1,7 +1,6 @@
 from mcp.server.fastmcp import FastMCP
-from datetime import datetime
 from BGC_PERSON import *
-from BGC_PLAY_SESSION import Table
+from BGC_PLAY_SESSION import Table, parse_datetime_str
 from ENUM_STATUS import BoardGameStatus
 import sys
 import os
@@ -26,6 +25,10 @@ except Exception as e:
     print(f"Server Setup Error: {e}", file=sys.stderr)
     sys.exit(1)
 
+# เส้นคั่นของใบเสร็จ (สร้างครั้งเดียวแล้วใช้ซ้ำ)
+_BILL_RULE = "─" * 64
+_ACTIVE_BILL_RULE = "-" * 65
+
 
 # --- STEP 4: Create Tools for Claude ---
 
@@ -147,8 +150,8 @@ def get_person_by_type(person_type: str) -> str:
 
         def format_person(p):
             if resolved == 'Member':
-                tier_name = p.get_member_tier().value if hasattr(p, 'get_member_tier') else 'None'
-                spent = p.get_total_spent() if hasattr(p, 'get_total_spent') else 0
+                tier_name = p.get_member_tier().value
+                spent = p.get_total_spent()
                 return f"ID: {p.user_id}, Name: {p.name}, Tier: {tier_name}, Total Spent: {spent}"
             return f"ID: {p.user_id}, Name: {p.name}"
 
@@ -302,12 +305,7 @@ def cancel_reservation(reservation_id: str, current_time: str = None) -> str:
     try:
         parsed_time = None
         if current_time is not None:
-            for fmt in ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%dT%H:%M", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M"):
-                try:
-                    parsed_time = datetime.strptime(current_time, fmt)
-                    break
-                except ValueError:
-                    continue
+            parsed_time = parse_datetime_str(current_time)
             if parsed_time is None:
                 return "Error: current_time format invalid. Use 'YYYY-MM-DD HH:MM'"
         res = system.cancel_reservation(reservation_id, parsed_time)
@@ -379,12 +377,7 @@ def check_in_reserved(reservation_id: str, customer_id: str, current_time: str =
     try:
         parsed_time = None
         if current_time is not None:
-            for fmt in ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%dT%H:%M", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M"):
-                try:
-                    parsed_time = datetime.strptime(current_time, fmt)
-                    break
-                except ValueError:
-                    continue
+            parsed_time = parse_datetime_str(current_time)
             if parsed_time is None:
                 return "Error: current_time format invalid. Use 'YYYY-MM-DD HH:MM'"
 
@@ -458,12 +451,7 @@ def borrow_board_game(play_session_id: str, board_game_id: str, current_time: st
     try:
         parsed_time = None
         if current_time is not None:
-            for fmt in ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%dT%H:%M", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M"):
-                try:
-                    parsed_time = datetime.strptime(current_time, fmt)
-                    break
-                except ValueError:
-                    continue
+            parsed_time = parse_datetime_str(current_time)
             if parsed_time is None:
                 return "Error: current_time format invalid. Use 'YYYY-MM-DD HH:MM'"
 
@@ -495,12 +483,7 @@ def take_order(play_session_id: str, menu_item_id: str, current_time: str = None
     try:
         parsed_time = None
         if current_time is not None:
-            for fmt in ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%dT%H:%M", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M"):
-                try:
-                    parsed_time = datetime.strptime(current_time, fmt)
-                    break
-                except ValueError:
-                    continue
+            parsed_time = parse_datetime_str(current_time)
             if parsed_time is None:
                 return "Error: current_time format invalid. Use 'YYYY-MM-DD HH:MM'"
 
@@ -587,14 +570,14 @@ def bill_history_by_person(person_id: str) -> str:
         lines = []
         for label, price in items:
             if price is None:
-                lines.append(f"{'─'*64}")
+                lines.append(_BILL_RULE)
                 lines.append(f"  {label}")
             elif label == "TOTAL":
                 lines.append(f"  >>> {label:<43}  ฿{price:.2f}")
             else:
                 sign = "-" if price < 0 else " "
                 lines.append(f"      {label:<43} {sign}฿{abs(price):.2f}")
-        lines.append(f"{'─'*64}")
+        lines.append(_BILL_RULE)
         return "\n".join(lines)
     except Exception as e:
         return f"Error: {e}"
@@ -628,12 +611,7 @@ def check_out(
     try:
         parsed_end = None
         if end_time is not None:
-            for fmt in ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%dT%H:%M", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M"):
-                try:
-                    parsed_end = datetime.strptime(end_time, fmt)
-                    break
-                except ValueError:
-                    continue
+            parsed_end = parse_datetime_str(end_time)
             if parsed_end is None:
                 return "Error: end_time format invalid. Use 'YYYY-MM-DD HH:MM'"
 
@@ -930,24 +908,31 @@ def get_overstayed_sessions(branch_id: str) -> str:
 
 
 @mcp.tool()
-def get_reservations(branch_id: str = None) -> str:
+def get_reservations(branch_id: str = None, limit: int = 100, offset: int = 0) -> str:
     """
-    List all reservations. Optionally filter by branch_id.
-    e.g. get_reservations()  or  get_reservations("BRCH-00000")
+    List reservations, at most `limit` per call starting at `offset`. Optionally filter by branch_id.
+    e.g. get_reservations()  or  get_reservations("BRCH-00000")  or  get_reservations(limit=20, offset=20)
     """
     try:
-        all_reservations = system.reservations
-        if branch_id:
-            all_reservations = [r for r in all_reservations if r.branch_id == branch_id]
-        if not all_reservations:
+        branch_id = branch_id or None
+        page = system.get_reservations(limit, offset, branch_id=branch_id)
+        total = len(system.get_reservations(branch_id=branch_id))
+        if total == 0:
             return "No reservations found"
+        if not page:
+            return f"No reservations at offset {offset} (total {total})"
         lines = []
-        for r in all_reservations:
+        for r in page:
             lines.append(
                 f"ID: {r.reservation_id} | Status: {r.status.value} | "
                 f"Customer: {r.customer_id} | Table: {r.table_id} | "
                 f"Date: {r.date} {r.start_time}-{r.end_time}"
             )
+        if offset + len(page) < total:
+            lines.append(
+                f"Showing {offset + 1}-{offset + len(page)} of {total}. "
+                f"Use offset={offset + len(page)} for more."
+            )
         return "\n".join(lines)
     except Exception as e:
         return f"Error: {e}"
@@ -963,12 +948,7 @@ def get_active_bill(play_session_id: str, current_time: str = None) -> str:
     try:
         parsed_time = None
         if current_time is not None:
-            for fmt in ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%dT%H:%M", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M"):
-                try:
-                    parsed_time = datetime.strptime(current_time, fmt)
-                    break
-                except ValueError:
-                    continue
+            parsed_time = parse_datetime_str(current_time)
             if parsed_time is None:
                 return "Error: current_time format invalid. Use 'YYYY-MM-DD HH:MM'"
 
@@ -993,9 +973,9 @@ def get_active_bill(play_session_id: str, current_time: str = None) -> str:
         duration = session.duration(now) # BUG FIX: added duration calculation
         
         lines = [f"=== Active Bill Preview for {session.session_id} ==="]
-        time_limit_str = f" | Reserved until: {session.reserved_end_time.strftime('%H:%M')}" if hasattr(session, 'reserved_end_time') and session.reserved_end_time else ""
+        time_limit_str = f" | Reserved until: {session.reserved_end_time.strftime('%H:%M')}" if session.reserved_end_time else ""
         lines.append(f"  Start: {session.start_time.strftime('%Y-%m-%d %H:%M')} | Now: {now.strftime('%H:%M')}{time_limit_str} | Duration: {duration:.2f} hr")
-        if hasattr(session, 'check_time_up') and session.check_time_up(now):
+        if session.check_time_up(now):
             lines.append("  ⚠️ ALERT: TIME IS UP!")
         lines.append("")
 
@@ -1004,7 +984,7 @@ def get_active_bill(play_session_id: str, current_time: str = None) -> str:
                 continue
             lines.append(f"  {label:<50} : ฿{amount:8.2f}")
 
-        lines.append("-" * 65)
+        lines.append(_ACTIVE_BILL_RULE)
         lines.append(f"  Estimated TOTAL {' ':<32} : ฿{active_bill['total_amount']:8.2f}")
         
         unreturned = session.current_board_games_id
@@ -1088,12 +1068,7 @@ def resolve_checkin_conflict(
 
         parsed_time = None
         if current_time and current_time.strip():
-            for fmt in ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%dT%H:%M", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M"):
-                try:
-                    parsed_time = datetime.strptime(current_time, fmt)
-                    break
-                except ValueError:
-                    continue
+            parsed_time = parse_datetime_str(current_time)
             if parsed_time is None:
                 return "Error: current_time format invalid. Use 'YYYY-MM-DD HH:MM'"
 
@@ -1145,12 +1120,7 @@ def auto_force_checkout(
 
         parsed_time = None
         if current_time and current_time.strip():
-            for fmt in ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%dT%H:%M", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M"):
-                try:
-                    parsed_time = datetime.strptime(current_time, fmt)
-                    break
-                except ValueError:
-                    continue
+            parsed_time = parse_datetime_str(current_time)
             if parsed_time is None:
                 return "Error: current_time format invalid. Use 'YYYY-MM-DD HH:MM'"
 
@@ -86,12 +86,12 @@ if __name__ == "__main__":
 
     print(f'\n{" TEST - ADD CUSTOMER TO SESSION ":═^64}\n')
     print(
-        f'{"BEFORE":<10}:\t{play_session.current_players_id} ',
+        f'{"BEFORE":<10}:\t{list(play_session.current_players_id)} ',
     )
     sys.join_session("PS-00000", "MEMBER-00001")
     sys.join_session("PS-00000")
     print(
-        f'{"AFTER":<10}:\t{play_session.current_players_id} ',
+        f'{"AFTER":<10}:\t{list(play_session.current_players_id)} ',
     )
     print(f'\n{"":═^64}\n')
 
@@ -99,12 +99,12 @@ if __name__ == "__main__":
 
     print(f'\n{" TEST - BORROW BOARD GAME ":═^64}\n')
     print(
-        f'{"BEFORE":<10}:\t{play_session.current_board_games_id} ',
+        f'{"BEFORE":<10}:\t{list(play_session.current_board_games_id)} ',
     )
     sys.borrow_board_game("TABLE-00002", "BG-00000")
     sys.borrow_board_game("TABLE-00002", "BG-00001")
     print(
-        f'{"AFTER":<10}:\t{play_session.current_board_games_id} ',
+        f'{"AFTER":<10}:\t{list(play_session.current_board_games_id)} ',
     )
     print(f'\n{"":═^64}\n')
 
@@ -84,7 +84,7 @@ if __name__ == "__main__":
 
     print("\n", " CHECKOUT RESULT ".center(60, "="), "\n")
 
-    print("Players:", play_session.current_players_id)
+    print("Players:", list(play_session.current_players_id))
 
     discount = 0
     for pid in play_session.current_players_id:
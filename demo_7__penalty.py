@@ -87,9 +87,9 @@ if __name__ == "__main__":
     # / ════════════════════════════════════════════════════════════════
 
     print(f'\n{" TEST - RETURN BOARD GAME (OK) ":═^64}\n')
-    print(f'{"BEFORE":<10}:\tgame_penalty = { play_session.game_penalty }')
+    print(f'{"BEFORE":<10}:\tgame_penalty = { list(play_session.game_penalty) }')
     sys.return_board_game("TABLE-00002", "BG-00000", is_damaged=False)
-    print(f'{"AFTER":<10}:\tgame_penalty = { play_session.game_penalty }')
+    print(f'{"AFTER":<10}:\tgame_penalty = { list(play_session.game_penalty) }')
     print(f'{"BG-00000":<10}:\t{ sys.find_board_game_by_id("BG-00000") }')
     print(f'\n{"":═^64}\n')
 
@@ -98,9 +98,9 @@ if __name__ == "__main__":
     # / ════════════════════════════════════════════════════════════════
 
     print(f'\n{" TEST - RETURN BOARD GAME (DAMAGED) ":═^64}\n')
-    print(f'{"BEFORE":<10}:\tgame_penalty = { play_session.game_penalty }')
+    print(f'{"BEFORE":<10}:\tgame_penalty = { list(play_session.game_penalty) }')
     sys.return_board_game("TABLE-00002", "BG-00001", is_damaged=True)
-    print(f'{"AFTER":<10}:\tgame_penalty = { play_session.game_penalty }')
+    print(f'{"AFTER":<10}:\tgame_penalty = { list(play_session.game_penalty) }')
     print(f'{"BG-00001":<10}:\t{ sys.find_board_game_by_id("BG-00001") }')
     print(f'\n{"":═^64}\n')
 
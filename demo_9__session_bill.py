@@ -2,6 +2,7 @@ from BGC import *
 from datetime import datetime, timedelta
 
 fake_time = datetime(2026, 3, 10, 15, 5, 0)
+BILL_RULE = "─" * 64
 
 if __name__ == "__main__":
     sys = CafeSystem()
@@ -129,14 +130,14 @@ if __name__ == "__main__":
 
     for label, price in sys.bill_history_by_person(member_a.user_id):
         if price is None:
-            print(f"{'─'*64}")
+            print(BILL_RULE)
             print(f"  {label}")
         elif label == "TOTAL":
             print(f"  >>> {label:<43}  ฿{price:.2f}")
         else:
             sign = "-" if price < 0 else " "
             print(f"      {label:<43} {sign}฿{abs(price):.2f}")
-    print(f"{'─'*64}")
+    print(BILL_RULE)
 
     print(f'\n{"":═^64}\n')
 
@@ -146,14 +147,14 @@ if __name__ == "__main__":
 
     for label, price in sys.bill_history_by_person(member_b.user_id):
         if price is None:
-            print(f"{'─'*64}")
+            print(BILL_RULE)
             print(f"  {label}")
         elif label == "TOTAL":
             print(f"  >>> {label:<43}  ฿{price:.2f}")
         else:
             sign = "-" if price < 0 else " "
             print(f"      {label:<43} {sign}฿{abs(price):.2f}")
-    print(f"{'─'*64}")
+    print(BILL_RULE)
 
     print(f'\n{"":═^64}\n')
 